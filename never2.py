@@ -25,8 +25,11 @@ Elena Botoeva
 
 import sys
 
+from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import QApplication
 
+import never2.resources.styling.display as disp
+import never2.resources.styling.palette as palette
 from never2.main_window import MainWindow
 
 if __name__ == '__main__':
@@ -35,6 +38,15 @@ if __name__ == '__main__':
 
     app = QApplication(sys.argv)
     app.setStyle('fusion')
+
+    # Style of the block contents, dialogs and custom widgets, parsed once for all the widgets
+    app.setStyleSheet(disp.read_qss('blocks.qss', 'custom.qss'))
+
+    # Placeholders are colored by the palette, QSS has no placeholder sub-control
+    app_palette = app.palette()
+    app_palette.setColor(QPalette.ColorRole.PlaceholderText, QColor(palette.GREY_4))
+    app.setPalette(app_palette)
+
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -7,6 +7,8 @@ Author: Andrea Gimelli, Giacomo Rosato, Stefano Demarchi
 
 """
 
+import ast
+
 import numpy as np
 from PyQt6.QtWidgets import QGraphicsItem
 from pynever.nodes import ConcreteLayerNode
@@ -374,7 +376,7 @@ class Scene:
                         else:
                             q_wdg.setText(str(node_param))
                 elif isinstance(q_wdg, CustomTextBox):
-                    if hasattr(added_node, param_name) and getattr(added_node, param_name) != eval(q_wdg.text()):
+                    if hasattr(added_node, param_name) and getattr(added_node, param_name) != ast.literal_eval(q_wdg.text()):
                         q_wdg.setText(rep.tuple2text(getattr(added_node, param_name), prod=False))
 
     def update_edges(self) -> None:
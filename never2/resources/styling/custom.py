@@ -7,70 +7,58 @@ Author: Stefano Demarchi
 
 """
 import logging
+from collections import deque
 
-from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QLabel, QComboBox, QLineEdit, QPlainTextEdit, QPushButton, QListWidget, QAbstractItemView
 
-import never2.resources.styling.display as disp
 import never2.resources.styling.palette as palette
 
 
 class CustomButton(QPushButton):
     def __init__(self, text: str = '', primary: bool = False, context: str = None):
-        super(CustomButton, self).__init__(text)
-        if primary:
-            self.setStyleSheet(disp.PRIMARY_BUTTON_STYLE)
-            self.setDefault(True)
-        else:
-            self.setStyleSheet(disp.BUTTON_STYLE)
-            self.setDefault(False)
-
-        if context == 'FunctionalBlock':
-            if text == 'Add property':
-                self.setStyleSheet(disp.PROPERTY_BUTTON_STYLE)
-            elif text == 'Update':
-                self.setStyleSheet(disp.UPDATE_FUNC_BUTTON_STYLE)
-        elif context == 'LayerBlock':
-            if primary:
-                self.setStyleSheet(disp.SAVE_LAYER_BUTTON_STYLE)
-            else:
-                self.setStyleSheet(disp.BUTTON_STYLE)
+        super().__init__(text)
+        self.setDefault(primary)
+
+        variant = 'primary' if primary else 'default'
+        if context == 'FunctionalBlock' and text == 'Add property':
+            variant = 'property'
+        elif context == 'LayerBlock' and primary:
+            variant = 'layer'
         elif context == 'Property':
             if text == 'Add':
-                self.setStyleSheet(disp.PRIMARY_BUTTON_STYLE)
+                variant = 'primary'
             elif text == 'Save':
-                self.setStyleSheet(disp.PROPERTY_BUTTON_STYLE)
+                variant = 'property'
+
+        # Styled by the application style sheet, see custom.qss
+        self.setProperty('variant', variant)
 
 
 class CustomLabel(QLabel):
     def __init__(self, text: str = '', color: str = 'white', primary: bool = False,
                  alignment=Qt.AlignmentFlag.AlignLeft, context: str = ''):
-        super(CustomLabel, self).__init__(text)
+        super().__init__(text)
+
+        # Styled by the application style sheet, see custom.qss
+        self.setProperty('primary', primary)
+        if context != '':
+            self.setProperty('context', context)
+
         if primary:
             self.setAlignment(Qt.AlignmentFlag.AlignLeft)
-            self.setStyleSheet(disp.NODE_LABEL_STYLE)
         else:
             self.setAlignment(alignment)
-            self.setStyleSheet('color: ' + color + ';' +
-                               'border: none;' +
-                               'padding: 2px 0px 2px 2px;')
-
-        if context == 'Property':
-            self.setStyleSheet(disp.PROPERTY_LABEL_STYLE)
+            if color != palette.WHITE:
+                self.setStyleSheet(f'color: {color};')
 
 
 class CustomComboBox(QComboBox):
     def __init__(self, color: str = 'white', context: str = 'LayerBlock'):
-        super(CustomComboBox, self).__init__()
-
-        if context == 'LayerBlock':
-            self.setStyleSheet('border: 2px solid' + palette.DARK_BLUE + ';')
-
-        elif context == 'FunctionalBlock':
-            self.setStyleSheet('border: 2px solid' + palette.GREY + ';')
+        super().__init__()
 
-        elif context == 'Property':
-            self.setStyleSheet('border: 2px solid' + palette.DARK_ORANGE + ';')
+        # Styled by the application style sheet, see custom.qss
+        self.setProperty('context', context)
 
     def text(self) -> str:
         return self.currentText()
@@ -81,56 +69,71 @@ class CustomComboBox(QComboBox):
 
 class CustomTextBox(QLineEdit):
     def __init__(self, text: str = '', color: str = 'white', context: str = None):
-        super(CustomTextBox, self).__init__()
+        super().__init__()
         self.setText(text)
 
-        if context == 'LayerBlock':
-            self.setStyleSheet('border: 2px solid' + palette.DARK_BLUE + ';')
-
-        elif context == 'FunctionalBlock':
-            self.setStyleSheet('border: 2px solid' + palette.GREY + ';')
-
-        elif context == 'Property':
-            self.setStyleSheet('border: 2px solid' + palette.DARK_ORANGE + ';')
+        # Styled by the application style sheet, see custom.qss
+        if context is not None:
+            self.setProperty('context', context)
 
 
 class CustomTextArea(QPlainTextEdit):
     def __init__(self, color: str = palette.WHITE, parent=None):
-        super(CustomTextArea, self).__init__(parent)
-        self.setStyleSheet('color: ' + color + ';' +
-                           'background-color: ' + palette.GREY_2 + ';' +
-                           'border: none;' +
-                           'padding: 2px;' +
-                           'QPlainTextEdit::placeholder {' +
-                           'color: ' + palette.GREY_4 + ';' +
-                           '}')
+        super().__init__(parent)
+
+        # Styled by the application style sheet, only a custom color is set here
+        if color != palette.WHITE:
+            self.setStyleSheet(f'color: {color};')
 
 
-class CustomLoggerTextArea(logging.Handler, QObject):
-    appendPlainText = pyqtSignal(str)
+class CustomLoggerTextArea(logging.Handler):
+    """
+    Logging handler displaying the records in a read-only text area.
+    Records may come from any thread: they are buffered and appended
+    in batches by a timer running in the GUI thread.
+
+    """
+
+    FLUSH_INTERVAL = 50
+    MAX_LINES = 5000
 
     def __init__(self, parent):
         super().__init__()
-        QObject.__init__(self)
 
         self.widget = CustomTextArea(parent=parent)
         self.widget.setReadOnly(True)
         self.widget.setFixedHeight(150)
-        self.appendPlainText.connect(self.widget.appendPlainText)
+        self.widget.setMaximumBlockCount(self.MAX_LINES)
+
+        # The appended text is never undone, do not record it
+        self.widget.setUndoRedoEnabled(False)
+
+        # deque appends and pops are thread-safe
+        self.pending = deque(maxlen=self.MAX_LINES)
+
+        # The timer belongs to the widget, so that it stops with it
+        self.timer = QTimer(self.widget)
+        self.timer.setInterval(self.FLUSH_INTERVAL)
+        self.timer.timeout.connect(self.flush_records)
+        self.timer.start()
 
     def emit(self, record: logging.LogRecord) -> None:
-        msg = self.format(record)
-        self.appendPlainText.emit(msg)
+        self.pending.append(self.format(record))
+
+    def flush_records(self) -> None:
+        lines = []
+        while self.pending:
+            lines.append(self.pending.popleft())
+
+        if lines:
+            self.widget.appendPlainText('\n'.join(lines))
 
 
 class CustomListBox(QListWidget):
     def __init__(self, color: str = palette.WHITE):
-        super(QListWidget, self).__init__()
+        super().__init__()
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.setStyleSheet('color: ' + color + ';' +
-                           'background-color: ' + palette.GREY_2 + ';' +
-                           'border: none;' +
-                           'padding: 2px;' +
-                           'QListWidget::placeholder {' +
-                           'color: ' + palette.GREY_4 + ';' +
-                           '}')
+
+        # Styled by the application style sheet, only a custom color is set here
+        if color != palette.WHITE:
+            self.setStyleSheet(f'color: {color};')
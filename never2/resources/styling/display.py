@@ -7,7 +7,36 @@ Author: Andrea Gimelli, Giacomo Rosato, Stefano Demarchi
 
 """
 
+from string import Template
+
 import never2.resources.styling.palette as palette
+from never2 import RES_DIR
+
+
+def read_qss(*names: str) -> str:
+    """
+    This method reads the given QSS files and fills their colors,
+    written as $NAME placeholders, with the values of the palette.
+
+    Parameters
+    ----------
+    names : str
+        The QSS file names in the qss directory.
+
+    Returns
+    ----------
+    str
+        The style sheet with the palette colors.
+
+    """
+
+    sheets = []
+    for name in names:
+        with open(RES_DIR + '/styling/qss/' + name, 'r', encoding='utf-8') as qss_file:
+            sheets.append(Template(qss_file.read()).substitute(vars(palette)))
+
+    return '\n'.join(sheets)
+
 
 VIEW_STYLE = ("QGraphicsView {"
               "border: 1px solid " + palette.GREY_2 + ";" +
@@ -113,28 +142,6 @@ DIM_NODE_STYLE = ("border: none;"
                   "color: " + palette.GREY_4 + ";")
 
 """ BLOCKS_LIST STYLESHEET """
-NODE_LABEL_STYLE = ("QLabel {"
-                    "color: white;"
-                    "background-color: " + palette.DARK_TEAL + ";" +
-                    "text-transform: uppercase;"
-                    "margin: 5px;"
-                    "padding: 4px;"
-                    "font-weight: bold;"
-                    "max-height: 17px;"
-                    "border-radius: 5px"
-                    "}")
-
-PROPERTY_LABEL_STYLE = ("QLabel {"
-                        "color: white;"
-                        "background-color: " + palette.DARK_ORANGE + ";" +
-                        "text-transform: uppercase;"
-                        "margin: 5px;"
-                        "padding: 4px;"
-                        "font-weight: bold;"
-                        "max-height: 17px;"
-                        "border-radius: 5px"
-                        "}")
-
 HIDDEN_LABEL_STYLE = ("height: 0px;"
                       "color: rgba(0, 0, 0, 0);"
                       "background-color: none;"
@@ -143,77 +150,6 @@ HIDDEN_LABEL_STYLE = ("height: 0px;"
                       "font-size: 1px;"
                       "border: none")
 
-ERROR_LABEL_STYLE = ("QLabel {"
-                     "color: white;"
-                     "background-color: " + palette.RED + ";" +
-                     "text-transform: uppercase;"
-                     "margin: 5px;"
-                     "padding: 4px;"
-                     "font-weight: bold;"
-                     "max-height: 17px;"
-                     "border-radius: 5px"
-                     "}")
-
-BUTTON_STYLE = ("QPushButton { "
-                "background-color: " + palette.GREY + ";" +
-                "color: white;"
-                "height: 25px;"
-                "border-radius: 5px;"
-                "}"
-                "QPushButton:hover:!pressed {"
-                "background-color: " + palette.LIGHT_GREY + ";" +
-                "}")
-
-PRIMARY_BUTTON_STYLE = ("QPushButton { "
-                        "background-color: " + palette.DARK_TEAL + ";" +
-                        "color: white;"
-                        "height: 25px;"
-                        "border-radius: 5px;"
-                        "}"
-                        "QPushButton:hover {"
-                        "background-color: " + palette.TEAL + ";" +
-                        "}"
-                        "QPushButton:pressed {"
-                        "border: 0;"
-                        "background-color: " + palette.DARK_TEAL + ";" +
-                        "}")
-
-SAVE_LAYER_BUTTON_STYLE = ("QPushButton { "
-                           "background-color: " + palette.DARK_BLUE + ";" +
-                           "color: white;"
-                           "height: 25px;"
-                           "border-radius: 5px;"
-                           "}"
-                           "QPushButton:hover {"
-                           "background-color: " + palette.BLUE + ";" +
-                           "border: 1px solid " + palette.DARK_BLUE + ";" +
-                           "}"
-
-                           "QPushButton:pressed {"
-                           "border: 0;"
-                           "background-color: " + palette.TEAL + ";" +
-                           "}")
-
-PROPERTY_BUTTON_STYLE = ("QPushButton { "
-                         "background-color: " + palette.DARK_ORANGE + ";" +
-                         "color: white;"
-                         "height: 25px;"
-                         "border-radius: 5px;"
-                         "}"
-                         "QPushButton:hover:!pressed {"
-                         "background-color: " + palette.ORANGE + ";" +
-                         "}")
-
-UPDATE_FUNC_BUTTON_STYLE = ("QPushButton { "
-                            "background-color: " + palette.GREY + ";" +
-                            "color: white;"
-                            "height: 25px;"
-                            "border-radius: 5px;"
-                            "}"
-                            "QPushButton:hover:!pressed {"
-                            "background-color: " + palette.LIGHT_GREY + ";" +
-                            "}")
-
 TOOLBAR_STYLE = ("background-color: " + palette.GREY_1 + ";" +
                  "padding: 4px;"
                  "QToolBar {"
@@ -236,10 +172,7 @@ VALUE_LABEL_STYLE = ("color: white;"
                      "background-color: " + palette.GREY_2 + ";" +
                      "text-align: left;"
                      "border: none;"
-                     "padding: 2px;"
-                     "QLineEdit::placeholder {"
-                     "color: " + palette.GREY_4 + ";" +
-                     "}")
+                     "padding: 2px;")
 
 UNEDITABLE_VALUE_LABEL_STYLE = ("color: white;"
                                 "text-align: left;"
@@ -249,10 +182,7 @@ NOT_ACCEPTABLE_INPUT = ("color: white;"
                         "background-color: " + palette.RED_2 + ";" +
                         "text-align: left;"
                         "border: none;"
-                        "padding: 2px;"
-                        "QLineEdit::placeholder {"
-                        "color: " + palette.GREY_4 + ";" +
-                        "}")
+                        "padding: 2px;")
 
 PARAM_LABEL_STYLE = ("color: white;"
                      "border: none;"
@@ -270,14 +200,6 @@ IN_DIM_LABEL_STYLE = ("color: white;"
                       "text-transform: uppercase;"
                       )
 
-PROPERTY_IN_DIM_LABEL_STYLE = ("color: white;"
-                               "border: none;"
-                               "border-bottom: 2px solid " + palette.DARK_ORANGE + ";" +
-                               "padding: 2px 0px 2px 2px;"
-                               "font-weight: bold;"
-                               "text-transform: uppercase;"
-                               )
-
 MENU_BAR_STYLE = ("QMenuBar, QMenu {"
                   "color: white;"
                   "background-color: " + palette.GREY_1 + ";" +
@@ -0,0 +1,212 @@
+"""
+Module cached_dataset.py
+
+This module contains the dataset wrappers for caching the transformed samples
+
+Author: Stefano Demarchi
+
+"""
+
+import hashlib
+import os
+import threading
+
+import torch
+from pynever.datasets import Dataset
+
+
+def get_cache_path(root: str, name: str, train: bool, transform) -> str:
+    """
+    This method computes the path of the cache file for a dataset
+    and a transform. The key is a stable digest, so that the cache
+    is shared across different runs of the application.
+
+    Parameters
+    ----------
+    root : str
+        The dataset root directory.
+    name : str
+        The dataset name.
+    train : bool
+        Flag for the training or test split.
+    transform : Transform
+        The transform applied to the samples.
+
+    Returns
+    ----------
+    str
+        The path of the cache file.
+
+    """
+
+    key = hashlib.sha1(f'{name}:{train}:{transform!r}'.encode('utf-8')).hexdigest()
+    return f'{root}cache/{key}.pt'
+
+
+def stack_labels(labels: list) -> torch.Tensor:
+    """
+    This method gathers the labels of the samples in a single tensor.
+    Tensor targets, as those of the generic file datasets, are stacked,
+    while plain class indices are converted at once.
+
+    Parameters
+    ----------
+    labels : list
+        The labels of the samples.
+
+    Returns
+    ----------
+    torch.Tensor
+        The tensor of the labels.
+
+    """
+
+    if len(labels) > 0 and isinstance(labels[0], torch.Tensor):
+        return torch.stack(labels)
+
+    return torch.as_tensor(labels)
+
+
+class CachedTransformDataset(Dataset):
+    """
+    This class wraps a dataset with a deterministic transform and stores
+    the transformed samples, so that the transform is computed once
+    instead of once per sample per epoch. Samples with a fixed shape
+    are stored as a single contiguous tensor and sliced by batch. If a
+    cache path is given the tensor is also saved on disk, and it is
+    memory-mapped when read back.
+
+    Attributes
+    ----------
+    base : Dataset
+        The wrapped dataset, already provided with its transform.
+    cache_path : str
+        The path of the file storing the transformed samples, or
+        None to keep them in memory only.
+    data : torch.Tensor
+        The contiguous tensor of the transformed samples.
+    labels : torch.Tensor
+        The tensor of the sample labels.
+    samples : list
+        The transformed samples when they cannot be stacked.
+
+    Methods
+    ----------
+    wait()
+        Procedure to ensure the samples are available.
+    load()
+        Procedure to read the samples from the cache or to build it.
+
+    """
+
+    def __init__(self, base: Dataset, cache_path: str | None = None):
+        self.base = base
+        self.cache_path = cache_path
+        self.data = None
+        self.labels = None
+        self.samples = None
+
+    def __getitem__(self, index: int) -> tuple:
+        if self.data is None and self.samples is None:
+            self.wait()
+
+        if self.data is not None:
+            return self.data[index], self.labels[index]
+
+        return self.samples[index]
+
+    def __getitems__(self, indices: list) -> list:
+        if self.data is None and self.samples is None:
+            self.wait()
+
+        # A single gather on the contiguous tensors replaces the per-index calls. The DataLoader
+        # is built by pynever with the default collate, so the batch is still split per sample
+        # here and stacked again by the collate
+        if self.data is not None:
+            return list(zip(self.data[indices], self.labels[indices]))
+
+        return [self.samples[i] for i in indices]
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    def wait(self) -> None:
+        """
+        This method loads the samples in the calling thread, unless they
+        are already available.
+
+        """
+
+        if self.data is None and self.samples is None:
+            self.load()
+
+    def load(self) -> None:
+        """
+        This method reads the transformed samples from the cache file if
+        present, otherwise computes them and writes the file. Samples
+        that are not tensors of a single shape are kept in memory only,
+        as are all the samples if there is no cache path.
+
+        """
+
+        if self.cache_path is not None and os.path.isfile(self.cache_path):
+            self.data, self.labels = torch.load(self.cache_path, mmap=True)
+            return
+
+        samples = [self.base[i] for i in range(len(self.base))]
+
+        if len(samples) > 0 and all(isinstance(x, torch.Tensor) and x.shape == samples[0][0].shape
+                                    for x, _ in samples):
+            self.data = torch.stack([x for x, _ in samples]).contiguous()
+            self.labels = stack_labels([y for _, y in samples])
+
+            if self.cache_path is None:
+                return
+
+            # Write aside and rename, so that a concurrent reader never sees a partial file
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f'{self.cache_path}.{threading.get_ident()}.tmp'
+            torch.save((self.data, self.labels), tmp_path)
+            os.replace(tmp_path, self.cache_path)
+        else:
+            self.samples = samples
+
+
+class GPUResidentDataset(Dataset):
+    """
+    This class keeps a whole dataset in the memory of the device, so that
+    the batches of every epoch are sliced there instead of being copied
+    from the host each time.
+
+    Attributes
+    ----------
+    data : torch.Tensor
+        The samples stored on the device.
+    labels : torch.Tensor
+        The labels stored on the device.
+
+    """
+
+    def __init__(self, base: Dataset, device: str):
+        if isinstance(base, CachedTransformDataset):
+            base.wait()
+
+        if isinstance(base, CachedTransformDataset) and base.data is not None:
+            data, labels = base.data, base.labels
+        else:
+            samples = [base[i] for i in range(len(base))]
+            data = torch.stack([torch.as_tensor(x) for x, _ in samples])
+            labels = stack_labels([y for _, y in samples])
+
+        self.data = data.to(device)
+        self.labels = labels.to(device)
+
+    def __getitem__(self, index: int) -> tuple:
+        return self.data[index], self.labels[index]
+
+    def __getitems__(self, indices: list) -> list:
+        # Gathered at once, then re-collated per sample by the default collate
+        return list(zip(self.data[indices], self.labels[indices]))
+
+    def __len__(self) -> int:
+        return len(self.labels)
@@ -7,12 +7,7 @@ Author: Andrea Gimelli, Giacomo Rosato, Stefano Demarchi
 
 """
 
-import onnx
-import torch
 from pynever.networks import NeuralNetwork
-from pynever.strategies.conversion.converters.onnx import ONNXConverter
-from pynever.strategies.conversion.converters.pytorch import PyTorchConverter
-from pynever.strategies.conversion.representation import ONNXNetwork, PyTorchNetwork, AlternativeRepresentation
 from pynever.strategies.smt_reading import ExpressionTreeConverter
 from pysmt.exceptions import PysmtException
 from pysmt.smtlib.parser import SmtLibParser
@@ -133,18 +128,38 @@ def read_properties(path: str) -> dict[str, PropertyContainer]:
     return properties
 
 
+def smt_property_to_string(props: dict, dtype: str) -> str:
+    """
+    This method builds the SMT-LIB text of the properties,
+    with the declarations of all the variables first.
+
+    Parameters
+    ----------
+    props : dict
+        The properties to write.
+    dtype : str
+        The SMT sort of the variables.
+
+    Returns
+    ----------
+    str
+        The SMT-LIB text.
+
+    """
+
+    # Variables
+    declarations = ''.join(f"(declare-const {v} {dtype})\n" for p in props.values() for v in p.variables)
+
+    # Constraints
+    constraints = ''.join(p.smt_string + "\n" for p in props.values())
+
+    return declarations + "\n" + constraints
+
+
 def write_smt_property(path: str, props: dict, dtype: str) -> None:
     # Create and write file
     with open(path, "w") as f:
-        # Variables
-        for p in props.values():
-            for v in p.variables:
-                f.write(f"(declare-const {v} {dtype})\n")
-        f.write("\n")
-
-        # Constraints
-        for p in props.values():
-            f.write(p.smt_string + "\n")
+        f.write(smt_property_to_string(props, dtype))
 
 
 class InputHandler:
@@ -189,17 +204,28 @@ class InputHandler:
         self.extension = path.split('.')[-1]
         net_id = path.split('/')[-1].replace(f'.{self.extension}', '')
 
+        # The converters bring in onnx and torch: import only the one required
         if self.extension in FileFormat.SUPPORTED_NETWORK_FORMATS['ONNX']:
+            import onnx
+            from pynever.strategies.conversion.converters.onnx import ONNXConverter
+            from pynever.strategies.conversion.representation import ONNXNetwork
+
             model_proto = onnx.load(path)
             self.alt_repr = ONNXNetwork(net_id, model_proto)
+            self.strategy = ONNXConverter()
 
         elif self.extension in FileFormat.SUPPORTED_NETWORK_FORMATS['PyTorch']:
+            import torch
+            from pynever.strategies.conversion.converters.pytorch import PyTorchConverter
+            from pynever.strategies.conversion.representation import PyTorchNetwork
+
             if not torch.cuda.is_available():
                 module = torch.load(path, map_location=torch.device('cpu'))
             else:
                 module = torch.load(path)
 
             self.alt_repr = PyTorchNetwork(net_id, module)
+            self.strategy = PyTorchConverter()
 
         # Convert the network
         if self.alt_repr is None:
@@ -209,12 +235,6 @@ class InputHandler:
             # Converting the network in the internal representation
             # If the chosen format has got an initial input for the network,
             # it is converted in the internal representation
-            if isinstance(self.alt_repr, ONNXNetwork):
-                self.strategy = ONNXConverter()
-
-            else:
-                self.strategy = PyTorchConverter()
-
             return self.strategy.to_neural_network(self.alt_repr)
 
 
@@ -285,7 +305,7 @@ class OutputHandler:
         self.extension = 'smt2'
         write_smt_property(path, properties, 'Real')
 
-    def convert_network(self, network: NeuralNetwork, filename: str) -> AlternativeRepresentation:
+    def convert_network(self, network: NeuralNetwork, filename: str) -> 'AlternativeRepresentation':
         """
         This method converts the internal representation into the chosen
         alternative representation, depending on the extension
@@ -309,10 +329,14 @@ class OutputHandler:
 
         if self.extension in FileFormat.SUPPORTED_NETWORK_FORMATS['ONNX'] or \
                 self.extension in FileFormat.SUPPORTED_NETWORK_FORMATS['VNNLIB']:
+            from pynever.strategies.conversion.converters.onnx import ONNXConverter
+
             self.strategy = ONNXConverter()
             self.alt_repr = self.strategy.from_neural_network(network)
 
         elif self.extension in FileFormat.SUPPORTED_NETWORK_FORMATS['PyTorch']:
+            from pynever.strategies.conversion.converters.pytorch import PyTorchConverter
+
             self.strategy = PyTorchConverter()
             self.alt_repr = self.strategy.from_neural_network(network)
         else:
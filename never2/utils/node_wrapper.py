@@ -288,7 +288,7 @@ class NodeFactory:
 
         if data['parameters']:
             for data_key, data_value in data['parameters'].items():
-                if type(data_value) is not str:
+                if not isinstance(data_value, str):
                     data['parameters'][data_key] = str(data_value)
 
         return data, node.identifier
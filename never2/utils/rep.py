@@ -7,6 +7,9 @@ Author: Andrea Gimelli, Giacomo Rosato, Stefano Demarchi
 
 """
 
+import ast
+import copy
+import functools
 import json
 import traceback
 
@@ -40,6 +43,48 @@ def read_json(path: str) -> dict:
     return dictionary
 
 
+@functools.lru_cache(maxsize=None)
+def read_json_cached(path: str) -> dict:
+    """
+    This method loads the content of a JSON file as read_json,
+    parsing each file only once. The dictionary returned is shared
+    and must not be modified.
+
+    Parameters
+    ----------
+    path : str
+        Path to JSON file.
+
+    Returns
+    ----------
+    dict
+        The shared dictionary.
+
+    """
+
+    return read_json(path)
+
+
+def read_json_copy(path: str) -> dict:
+    """
+    This method returns a private copy of the cached content of
+    a JSON file, which can be modified freely.
+
+    Parameters
+    ----------
+    path : str
+        Path to JSON file.
+
+    Returns
+    ----------
+    dict
+        A copy of the dictionary built.
+
+    """
+
+    return copy.deepcopy(read_json_cached(path))
+
+
 def read_json_data() -> tuple:
     with open(JSON_PATH + '/blocks.json', 'r') as fdata:
         block_data = json.load(fdata)
@@ -96,10 +141,12 @@ def create_variables_from(v_name: str, v_dim: tuple) -> list:
     return var_list
 
 
+@functools.lru_cache(maxsize=256)
 def text2tuple(text: str) -> tuple:
     """
     This method takes a string in format '(n,m,l)...' and
     converts it into a variable of type tuple with the given dimensions.
+    The same shapes are parsed over and over, so the results are cached.
 
     Parameters
     ----------
@@ -113,18 +160,12 @@ def text2tuple(text: str) -> tuple:
 
     """
 
-    output_tuple = tuple()
     text = str(text)
 
-    if len(text.split(",")) > 1:
-        for token in text.replace("(", "").replace(")", "").split(","):
-            if token != "":
-                num = int(token)
-                output_tuple += (num,)
+    if ',' in text:
+        return tuple([int(token) for token in text.replace('(', '').replace(')', '').split(',') if token != ''])
     else:
-        output_tuple += (int(text),)
-
-    return output_tuple
+        return int(text),
 
 
 def tuple2text(tup: tuple, prod: bool = True) -> str:
@@ -146,6 +187,15 @@ def tuple2text(tup: tuple, prod: bool = True) -> str:
 
     """
 
+    if prod:
+        separator = ' x '
+    else:
+        separator = ', '
+
+    # Shapes are tuples, their strings are cached
+    if isinstance(tup, tuple):
+        return shape2text(tup, separator)
+
     dim_list = list(str(tup).replace('(', '').strip().replace(')', '').strip().split(','))
     if '' in dim_list:
         dim_list.remove('')
@@ -153,17 +203,43 @@ def tuple2text(tup: tuple, prod: bool = True) -> str:
     if len(dim_list) == 1:
         return str(tup).replace('(', '').replace(')', '').replace(',', '')
 
-    if prod:
-        separator = ' x '
-    else:
-        separator = ', '
-
     dim_list = [x.strip() for x in str(tup).replace('(', '').strip().replace(')', '').strip().split(',')]
     new_format = separator.join(dim_list)
 
     return new_format
 
 
+@functools.lru_cache(maxsize=1024)
+def shape2text(shape: tuple, separator: str) -> str:
+    """
+    This function joins the dimensions of a shape with the given separator.
+    The results are cached, as the same shapes are written on every update.
+
+    Parameters
+    ----------
+    shape : tuple
+        The shape to write.
+    separator : str
+        The string between two dimensions.
+
+    Returns
+    ----------
+    str
+        The shape as a string.
+
+    """
+
+    return separator.join([str(d) for d in shape])
+
+
+# Conversion of the block parameters text, by parameter type
+PARAM_PARSERS = {'Tensor': text2tuple,
+                 'int': int,
+                 'list of ints': lambda text: [int(v) for v in text.split(',')],
+                 'boolean': lambda text: text == 'True',
+                 'float': float}
+
+
 def format_data(params: dict) -> dict:
     """
     This function re-formats a complete dictionary of block attributes in the format
@@ -183,23 +259,13 @@ def format_data(params: dict) -> dict:
     """
 
     converted_dict = dict()
-    value = None
 
     try:
         for param_name, param_value in params.items():
-            if param_value[1] == '':
+            parser = PARAM_PARSERS.get(param_value[2])
+            if param_value[1] == '' or parser is None:
                 continue
-            if param_value[2] == 'Tensor':
-                value = text2tuple(param_value[1])
-            elif param_value[2] == 'int':
-                value = int(param_value[1])
-            elif param_value[2] == 'list of ints':
-                value = list(map(int, param_value[1].split(', ')))
-            elif param_value[2] == 'boolean':
-                value = param_value[1] == 'True'
-            elif param_value[2] == 'float':
-                value = float(param_value[1])
-            converted_dict[param_name] = value
+            converted_dict[param_name] = parser(param_value[1])
     except Exception as e:
         dialog = MessageDialog(str(e), MessageType.ERROR)
         dialog.exec()
@@ -235,7 +301,7 @@ def force_types(dictionary: dict) -> dict:
                 elif element["type"] == "float":
                     dictionary[key]["value"] = float(element["value"])
                 elif element["type"] == "tuple":
-                    dictionary[key]["value"] = eval(element["value"])
+                    dictionary[key]["value"] = ast.literal_eval(element["value"])
             else:
                 dictionary[key] = force_types(element)
     return dictionary
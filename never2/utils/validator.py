@@ -14,17 +14,19 @@ from PyQt6.QtGui import QIntValidator, QDoubleValidator, QRegularExpressionValid
 class ArithmeticValidator:
     """
     This class collects the possible validators for
-    the editing dialogs.
+    the editing dialogs. They are built once at import
+    and shared by reference among all the widgets.
 
     INT : (QIntValidator)
         Integer validator.
     FLOAT : (QDoubleValidator)
         Floating-point validator.
-    TENSOR : (QRegExpValidator)
-        Tensor ("nxmxl", "nXmXl", "n,m,l") with n, m, l
-        integers validator.
-    TENSOR_LIST : (QRegExpValidator)
-        List of Tensors.
+    TENSOR : (QRegularExpressionValidator)
+        Tensor ("n,m,l") with n, m, l integers validator.
+    SAMPLE : (QRegularExpressionValidator)
+        Comma-separated list of non-negative numbers validator.
+    BY_TYPE : (dict)
+        The validator of each parameter type.
 
     """
 
@@ -36,7 +38,21 @@ class ArithmeticValidator:
     FLOAT = QDoubleValidator()
     FLOAT.setLocale(locale)
 
-    TENSOR = QRegularExpressionValidator(QRegularExpression('(([0-9])+(,\s?[0-9]+)*)'))
+    # The expressions are compiled here, not on the first validation
+    TENSOR_RE = QRegularExpression(r'[0-9]+(,\s?[0-9]+)*')
+    TENSOR_RE.optimize()
+    SAMPLE_RE = QRegularExpression(r'(?:\d+(?:\.\d*)?|\.\d+)(?:,(?:\d+(?:\.\d*)?|\.\d+))*')
+    SAMPLE_RE.optimize()
+
+    TENSOR = QRegularExpressionValidator(TENSOR_RE)
     TENSOR.setLocale(locale)
 
-    SAMPLE = QRegularExpressionValidator(QRegularExpression('^(?:\d+(?:\.\d*)?|\.\d+)(?:,(?:\d+(?:\.\d*)?|\.\d+))*$'))
+    SAMPLE = QRegularExpressionValidator(SAMPLE_RE)
+
+    # Validator of each parameter type found in the JSON descriptions
+    BY_TYPE = {'int': INT,
+               'float': FLOAT,
+               'tensor': TENSOR,
+               'tuple': TENSOR,
+               'Tensor': TENSOR,
+               'list of ints': TENSOR}
@@ -0,0 +1,67 @@
+"""
+Module worker.py
+
+This module contains the task class for running long procedures outside the GUI thread
+
+Author: Stefano Demarchi
+
+"""
+
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Pool shared by the long tasks of the application, run one at a time
+TASK_POOL = QThreadPool()
+TASK_POOL.setMaxThreadCount(1)
+
+
+class TaskSignals(QObject):
+    """
+    This class holds the signals of an AsyncTask, since a QRunnable
+    is not a QObject and cannot emit by itself.
+
+    Attributes
+    ----------
+    finished : pyqtSignal
+        Signal carrying the result of the task.
+    error : pyqtSignal
+        Signal carrying the message of the exception raised by the task.
+
+    """
+
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class AsyncTask(QRunnable):
+    """
+    This class runs a task in a thread of a QThreadPool, and reports
+    the outcome to the GUI thread by signals.
+
+    Attributes
+    ----------
+    task : Callable
+        The procedure to run, with no arguments.
+    signals : TaskSignals
+        The signals reporting the outcome of the task.
+
+    Methods
+    ----------
+    run()
+        Procedure to execute the task.
+
+    """
+
+    def __init__(self, task: Callable):
+        super().__init__()
+        self.task = task
+        self.signals = TaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.task()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
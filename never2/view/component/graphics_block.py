@@ -16,7 +16,7 @@ from PyQt6.QtWidgets import QGraphicsItem, QWidget, QGraphicsProxyWidget, QGraph
 
 import never2.resources.styling.dimension as dim
 import never2.resources.styling.palette as palette
-from never2 import get_classname, RES_DIR
+from never2 import get_classname
 from never2.resources.styling.custom import CustomTextBox, CustomLabel, CustomComboBox, CustomButton
 from never2.utils.validator import ArithmeticValidator
 from never2.view.ui.dialogs.message import ConfirmDialog, MessageDialog, MessageType
@@ -232,10 +232,6 @@ class BlockContentWidget(QWidget):
         # Concrete parameters
         self.wdg_param_dict = dict()
 
-        # Set style
-        with open(RES_DIR + '/styling/qss/blocks.qss') as qss_file:
-            self.setStyleSheet(qss_file.read())
-
         # Layouts
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -426,15 +422,7 @@ class BlockContentWidget(QWidget):
                 qt_wdg.editingFinished.connect(lambda: self.check_values(param_name, prev))
 
                 # Set proper validator
-                validator = None
-                param_type = param_info['type']
-                if param_type == 'int':
-                    validator = ArithmeticValidator.INT
-                elif param_type == 'float':
-                    validator = ArithmeticValidator.FLOAT
-                elif param_type == 'Tensor' or param_type == 'list of ints':
-                    validator = ArithmeticValidator.TENSOR
-                qt_wdg.setValidator(validator)
+                qt_wdg.setValidator(ArithmeticValidator.BY_TYPE.get(param_info['type']))
 
     def on_button_click(self):
         """
@@ -522,7 +510,7 @@ class BlockContentWidget(QWidget):
         buttons = [self.buttons_layout.itemAt(i).widget() for i in range(self.buttons_layout.count())]
 
         for widget in widgets:
-            if isinstance(widget, CustomTextBox) or isinstance(widget, CustomComboBox):
+            if isinstance(widget, (CustomTextBox, CustomComboBox)):
                 # Free to add property
                 if isinstance(widget, CustomComboBox) and get_classname(self.block_ref) == 'FunctionalBlock':
                     continue
@@ -623,7 +611,7 @@ class BlockContentWidget(QWidget):
                 for param_name, param_value in self.wdg_param_dict.items():
                     q_wdg = param_value[0]
 
-                    if isinstance(q_wdg, CustomTextBox) or isinstance(q_wdg, CustomComboBox):
+                    if isinstance(q_wdg, (CustomTextBox, CustomComboBox)):
                         self.wdg_param_dict[param_name][1] = q_wdg.text()
 
                 # Update pynever node
@@ -658,7 +646,7 @@ class BlockContentWidget(QWidget):
                     if 'default' in self.block_ref.attr_dict['parameters'][param_name]:
                         default_value = self.block_ref.attr_dict['parameters'][param_name]['default']
 
-                        if isinstance(q_widget, CustomTextBox) or isinstance(q_widget, CustomComboBox):
+                        if isinstance(q_widget, (CustomTextBox, CustomComboBox)):
                             q_widget.setText(default_value)
                     else:
                         if isinstance(q_widget, CustomTextBox):
@@ -120,8 +120,7 @@ class BlockInspector(QWidget):
         # Parameters section
         if 'parameters' in description.keys():
             if len(description['parameters'].items()) > 0:
-                self.parameters_label = CustomLabel('Parameters')
-                self.parameters_label.setStyleSheet(disp.NODE_LABEL_STYLE)
+                self.parameters_label = CustomLabel('Parameters', primary=True)
 
                 self.parameters_layout = QVBoxLayout()
                 self.parameters_layout.setSpacing(0)
@@ -134,8 +133,7 @@ class BlockInspector(QWidget):
                     self.parameters_layout.addWidget(DropDownLabel(par, values))
 
         if 'input' in description.keys():
-            self.inputs_label = CustomLabel('Input')
-            self.inputs_label.setStyleSheet(disp.NODE_LABEL_STYLE)
+            self.inputs_label = CustomLabel('Input', primary=True)
 
             self.inputs_layout = QVBoxLayout()
             self.inputs_layout.setSpacing(0)
@@ -148,8 +146,7 @@ class BlockInspector(QWidget):
                 self.inputs_layout.addWidget(DropDownLabel(par, values))
 
         if 'output' in description.keys():
-            self.outputs_label = CustomLabel('Output')
-            self.outputs_label.setStyleSheet(disp.NODE_LABEL_STYLE)
+            self.outputs_label = CustomLabel('Output', primary=True)
 
             self.outputs_layout = QVBoxLayout()
             self.outputs_layout.setSpacing(0)
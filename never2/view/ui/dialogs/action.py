@@ -27,6 +27,8 @@ class ComposeTransformDialog(TwoButtonsDialog):
     ----------
     trList : list
         List of transform objects selected by the user.
+    FACTORIES : dict
+        Builder of each transform from its parameters.
     Methods
     ----------
     initUI()
@@ -39,6 +41,13 @@ class ComposeTransformDialog(TwoButtonsDialog):
         Fills the trList parameter to return
     """
 
+    # Builders of the transforms, given their 2-level parameters
+    FACTORIES = {'ToTensor': lambda p: tr.ToTensor(),
+                 'PILToTensor': lambda p: tr.PILToTensor(),
+                 'Normalize': lambda p: tr.Normalize(p['Mean']['value'], p['Std deviation']['value']),
+                 'Flatten': lambda p: torch.nn.Flatten(0),
+                 'ToPILImage': lambda p: tr.ToPILImage()}
+
     def __init__(self):
         super().__init__('Dataset transform - composition', '')
         # List to return
@@ -92,14 +101,10 @@ class ComposeTransformDialog(TwoButtonsDialog):
         tr_layout.addLayout(right_layout)
         self.layout.addLayout(tr_layout)
 
-        transform = rep.read_json(RES_DIR + '/json/transform.json')
-        for t in transform.keys():
-            self.available.addItem(t)
-
-            if transform[t]:
-                self.params_2level[t] = {}
-                for k, v in transform[t].items():
-                    self.params_2level[t][k] = v
+        # The copy is private to the dialog, its parameters are used as they are
+        transform = rep.read_json_copy(RES_DIR + '/json/transform.json')
+        self.available.addItems(list(transform.keys()))
+        self.params_2level = {t: params for t, params in transform.items() if params}
 
     def add_transform(self):
         """
@@ -140,17 +145,8 @@ class ComposeTransformDialog(TwoButtonsDialog):
 
         for idx in range(self.selected.count()):
             t = self.selected.item(idx).text()
-            if t == 'ToTensor':
-                self.trList.append(tr.ToTensor())
-            elif t == 'PILToTensor':
-                self.trList.append(tr.PILToTensor())
-            elif t == 'Normalize':
-                self.trList.append(tr.Normalize(self.params_2level['Normalize']['Mean']['value'],
-                                                self.params_2level['Normalize']['Std deviation']['value']))
-            elif t == 'Flatten':
-                self.trList.append(tr.Lambda(lambda x: torch.flatten(x)))
-            elif t == 'ToPILImage':
-                self.trList.append(tr.ToPILImage())
+            if t in self.FACTORIES:
+                self.trList.append(self.FACTORIES[t](self.params_2level.get(t)))
 
 
 class Param2levelDialog(TwoButtonsDialog):
@@ -168,7 +164,7 @@ class Param2levelDialog(TwoButtonsDialog):
     """
 
     def __init__(self, param_dict: dict, t_name: str):
-        super(Param2levelDialog, self).__init__('Parameters required', '')
+        super().__init__('Parameters required', '')
         g_layout = QGridLayout()
         self.layout.addLayout(g_layout)
         self.params = {}
@@ -189,7 +185,8 @@ class Param2levelDialog(TwoButtonsDialog):
             g_layout.addWidget(input_widgets[name], count, 1)
             self.params[name] = val['value']
 
-            input_widgets[name].textChanged.connect(activation_f(name))
+            # Numeric values are committed once the editing is over
+            input_widgets[name].editingFinished.connect(activation_f(name))
 
             count += 1
 
@@ -221,7 +218,7 @@ class MixedVerificationDialog(TwoButtonsDialog):
         target_label = CustomLabel('Neurons number')
         target_edit = CustomTextBox()
         target_edit.setValidator(ArithmeticValidator.INT)
-        target_edit.textChanged.connect(lambda: self.update_neurons(target_edit.text()))
+        target_edit.editingFinished.connect(lambda: self.update_neurons(target_edit.text()))
         g_layout.addWidget(target_label, 0, 0)
         g_layout.addWidget(target_edit, 0, 1)
 
@@ -10,7 +10,6 @@ Author: Andrea Gimelli, Giacomo Rosato, Stefano Demarchi
 from PyQt6 import QtWidgets
 from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QGridLayout
 
-from never2 import RES_DIR
 from never2.resources.styling.custom import CustomLabel, CustomButton, CustomComboBox, CustomTextBox
 
 
@@ -48,10 +47,6 @@ class BaseDialog(QtWidgets.QDialog):
             self.setWindowTitle(self.title)
         self.setModal(True)
 
-        # apply same QLineEdit and QComboBox style of the block contents
-        qss_file = open(RES_DIR + '/styling/qss/blocks.qss').read()
-        self.setStyleSheet(qss_file)
-
     def set_title(self, title: str) -> None:
         """
         This method updates the dialog title.
@@ -82,11 +77,14 @@ class BaseDialog(QtWidgets.QDialog):
     def render_layout(self) -> None:
         """
         This method updates the main_layout with the changes done
-        in the child class(es).
+        in the child class(es). The layout is installed only once,
+        as setting it again would invalidate the whole geometry.
 
         """
 
-        self.setLayout(self.layout)
+        # self.layout shadows the QWidget getter, read the installed layout from Qt
+        if super().layout() is not self.layout:
+            self.setLayout(self.layout)
 
 
 class SingleButtonDialog(BaseDialog):
@@ -108,7 +106,7 @@ class SingleButtonDialog(BaseDialog):
     """
 
     def __init__(self, title: str = 'Dialog', message: str = ''):
-        super(SingleButtonDialog, self).__init__(title, message)
+        super().__init__(title, message)
         self.button = CustomButton('Ok', primary=True)
         self.button.clicked.connect(self.close)
 
@@ -122,7 +120,7 @@ class SingleButtonDialog(BaseDialog):
         """
 
         self.layout.addWidget(self.button)
-        self.setLayout(self.layout)
+        super().render_layout()
 
 
 class TwoButtonsDialog(BaseDialog):
@@ -150,7 +148,7 @@ class TwoButtonsDialog(BaseDialog):
     """
 
     def __init__(self, title: str = 'Dialog', message: str = '', context: str = 'None'):
-        super(TwoButtonsDialog, self).__init__(title, message)
+        super().__init__(title, message)
 
         self.has_been_closed = False
 
@@ -177,7 +175,7 @@ class TwoButtonsDialog(BaseDialog):
         """
 
         self.layout.addLayout(self.button_layout)
-        self.setLayout(self.layout)
+        super().render_layout()
 
 
 class GenericDatasetDialog(TwoButtonsDialog):
@@ -197,6 +195,8 @@ class GenericDatasetDialog(TwoButtonsDialog):
 
     """
 
+    DATA_TYPES = {'float': float, 'int': int}
+
     def __init__(self):
         super().__init__('Dataset - additional parameters', '')
         g_layout = QGridLayout()
@@ -206,7 +206,7 @@ class GenericDatasetDialog(TwoButtonsDialog):
 
         data_type_label = CustomLabel('Data type')
         data_type_edit = CustomComboBox()
-        data_type_edit.addItems(['float', 'int'])
+        data_type_edit.addItems(list(self.DATA_TYPES))
         data_type_edit.activated. \
             connect(lambda: self.update_dict('data_type', data_type_edit.currentText()))
         g_layout.addWidget(data_type_label, 0, 0)
@@ -226,9 +226,8 @@ class GenericDatasetDialog(TwoButtonsDialog):
         if key in self.params.keys():
             if key == "delimiter":
                 self.params[key] = value
-            else:
-                if value != '':
-                    self.params[key] = eval(value)
+            elif value in self.DATA_TYPES:
+                self.params[key] = self.DATA_TYPES[value]
 
     def reset(self):
         self.params = {'data_type': float,
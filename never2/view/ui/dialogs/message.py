@@ -12,7 +12,6 @@ from typing import Callable
 
 from PyQt6.QtCore import Qt
 
-import never2.resources.styling.display as disp
 from never2.resources.styling.custom import CustomLabel
 from never2.view.ui.dialogs.dialog import SingleButtonDialog, TwoButtonsDialog
 
@@ -38,11 +37,9 @@ class MessageDialog(SingleButtonDialog):
 
         # Set the dialog stile depending on message_type
         if message_type == MessageType.MESSAGE:
-            title_label = CustomLabel('Message', alignment=Qt.AlignmentFlag.AlignCenter)
-            title_label.setStyleSheet(disp.NODE_LABEL_STYLE)
+            title_label = CustomLabel('Message', alignment=Qt.AlignmentFlag.AlignCenter, context='Message')
         else:
-            title_label = CustomLabel('Error', alignment=Qt.AlignmentFlag.AlignCenter)
-            title_label.setStyleSheet(disp.ERROR_LABEL_STYLE)
+            title_label = CustomLabel('Error', alignment=Qt.AlignmentFlag.AlignCenter, context='Error')
 
         # Set content label
         mess_label = CustomLabel(f"\n{self.content}\n", alignment=Qt.AlignmentFlag.AlignCenter)
@@ -64,13 +61,12 @@ class FuncDialog(TwoButtonsDialog):
 
     def __init__(self, message: str, ok_fun: Callable):
         super().__init__('', message)
-        title_label = CustomLabel('Message', alignment=Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet(disp.NODE_LABEL_STYLE)
+        title_label = CustomLabel('Message', alignment=Qt.AlignmentFlag.AlignCenter, context='Message')
         # Set content label
         mess_label = CustomLabel(f"\n{self.content}\n", alignment=Qt.AlignmentFlag.AlignCenter)
 
-        # Connect function
-        self.ok_btn.clicked.connect(lambda: ok_fun)
+        # Connect function, without forwarding the 'checked' argument of the signal
+        self.ok_btn.clicked.connect(lambda: ok_fun())
 
         self.layout.addWidget(title_label)
         self.layout.addWidget(mess_label)
@@ -94,8 +90,7 @@ class ConfirmDialog(TwoButtonsDialog):
         super().__init__(title, message)
 
         # Set title label
-        title_label = CustomLabel('Warning', alignment=Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet(disp.NODE_LABEL_STYLE)
+        title_label = CustomLabel('Warning', alignment=Qt.AlignmentFlag.AlignCenter, context='Message')
 
         # Set message label
         mess_label = CustomLabel(f"\n{self.content}\n", alignment=Qt.AlignmentFlag.AlignCenter)
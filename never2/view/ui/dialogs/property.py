@@ -7,11 +7,11 @@ Author: Stefano Demarchi
 
 """
 
+import ast
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QGridLayout
 
-import never2.resources.styling.display as disp
-from never2 import RES_DIR
 from never2.resources.styling.custom import CustomLabel, CustomTextArea, CustomComboBox, CustomTextBox, CustomButton
 from never2.utils.validator import ArithmeticValidator
 from never2.view.ui.dialogs.dialog import TwoButtonsDialog, BaseDialog
@@ -36,10 +36,6 @@ class PropertyDialog(TwoButtonsDialog):
         self.property_block = property_block
         self.has_edits = False
 
-        # apply same QLineEdit and QComboBox style of the block contents
-        qss_file = open(RES_DIR + '/styling/qss/blocks.qss').read()
-        self.setStyleSheet(qss_file)
-
 
 class EditSmtPropertyDialog(PropertyDialog):
     """
@@ -72,8 +68,7 @@ class EditSmtPropertyDialog(PropertyDialog):
         g_layout.addWidget(title_label, 0, 0, 1, 2)
 
         # Input box
-        smt_label = CustomLabel('SMT-LIB definition', context='Property')
-        smt_label.setStyleSheet(disp.PROPERTY_IN_DIM_LABEL_STYLE)
+        smt_label = CustomLabel('SMT-LIB definition', context='PropertyField')
         smt_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         g_layout.addWidget(smt_label, 1, 0)
 
@@ -109,6 +104,9 @@ class EditPolyhedralPropertyDialog(BaseDialog):
 
     Methods
     ----------
+    build_header(QGridLayout)
+        Procedure to add the static title and labels to the grid.
+
     add_entry(str, str, str)
         Procedure to append the current constraint to the property list.
 
@@ -120,6 +118,11 @@ class EditPolyhedralPropertyDialog(BaseDialog):
 
     """
 
+    # Static header of the grid, shared by all the instances
+    TITLE = 'Polyhedral property'
+    HEADER_LABELS = ('Variable', 'Operator', 'Value')
+    OPERATORS = ['<=', '<', '>', '>=']
+
     def __init__(self, property_block: 'PropertyBlock'):
         super().__init__('Edit property', '')
         self.property_block = property_block
@@ -132,28 +135,14 @@ class EditPolyhedralPropertyDialog(BaseDialog):
         grid = QGridLayout()
 
         # Build main_layout
-        title_label = CustomLabel('Polyhedral property', primary=True, context='Property')
-        grid.addWidget(title_label, 0, 0, 1, 3)
-
-        # Labels
-        var_label = CustomLabel('Variable', primary=True, context='Property')
-        grid.addWidget(var_label, 1, 0)
-
-        relop_label = CustomLabel('Operator', primary=True, context='Property')
-        grid.addWidget(relop_label, 1, 1)
-
-        value_label = CustomLabel('Value', primary=True, context='Property')
-        grid.addWidget(value_label, 1, 2)
+        self.build_header(grid)
 
         self.var_cb = CustomComboBox(context='Property')
-        for v in property_block.variables:
-            self.var_cb.addItem(v)
+        self.var_cb.addItems(list(property_block.variables))
         grid.addWidget(self.var_cb, 2, 0)
 
         self.op_cb = CustomComboBox(context='Property')
-        operators = ['<=', '<', '>', '>=']
-        for o in operators:
-            self.op_cb.addItem(o)
+        self.op_cb.addItems(self.OPERATORS)
         grid.addWidget(self.op_cb, 2, 1)
 
         self.val = CustomTextBox(context='Property')
@@ -182,6 +171,24 @@ class EditPolyhedralPropertyDialog(BaseDialog):
         self.layout.addWidget(self.viewer, 3)
         self.render_layout()
 
+    @classmethod
+    def build_header(cls, grid: QGridLayout) -> None:
+        """
+        This method fills the first two rows of the grid with the
+        static title and column labels of the dialog.
+
+        Parameters
+        ----------
+        grid : QGridLayout
+            The grid layout of the dialog.
+
+        """
+
+        grid.addWidget(CustomLabel(cls.TITLE, primary=True, context='Property'), 0, 0, 1, len(cls.HEADER_LABELS))
+
+        for column, text in enumerate(cls.HEADER_LABELS):
+            grid.addWidget(CustomLabel(text, primary=True, context='Property'), 1, column)
+
     def add_entry(self) -> None:
         self.val.clearFocus()
         var = self.var_cb.currentText()
@@ -205,7 +212,7 @@ class EditPolyhedralPropertyDialog(BaseDialog):
 
     def show_properties_viewer(self):
         if self.property_block.label_string:
-            self.viewer.appendPlainText(self.property_block.label_string)
+            self.viewer.setPlainText(self.property_block.label_string)
 
 
 class EditBoxPropertyDialog(PropertyDialog):
@@ -241,8 +248,8 @@ class EditBoxPropertyDialog(PropertyDialog):
 
         if self.property_block.label_string != '':
             bounds = self.property_block.label_string.split('::')
-            self.lower_bounds = eval(bounds[0])
-            self.upper_bounds = eval(bounds[1])
+            self.lower_bounds = ast.literal_eval(bounds[0])
+            self.upper_bounds = ast.literal_eval(bounds[1])
 
         g_layout = QGridLayout()
         self.layout.addLayout(g_layout)
@@ -257,19 +264,17 @@ class EditBoxPropertyDialog(PropertyDialog):
         g_layout.addWidget(hint_label, 1, 0, 1, 2)
 
         # Lower bounds
-        lbs_label = CustomLabel('Lower bounds', alignment=Qt.AlignmentFlag.AlignRight)
-        lbs_label.setStyleSheet(disp.PROPERTY_IN_DIM_LABEL_STYLE)
+        lbs_label = CustomLabel('Lower bounds', alignment=Qt.AlignmentFlag.AlignRight, context='PropertyField')
         g_layout.addWidget(lbs_label, 2, 0)
 
-        self.lbs_box = CustomTextBox(f'{[lb for lb in self.lower_bounds]}'.replace('[', '').replace(']', ''))
+        self.lbs_box = CustomTextBox(', '.join(map(repr, self.lower_bounds)))
         g_layout.addWidget(self.lbs_box, 2, 1)
 
         # Upper bounds
-        ubs_label = CustomLabel('Upper bounds', alignment=Qt.AlignmentFlag.AlignRight)
-        ubs_label.setStyleSheet(disp.PROPERTY_IN_DIM_LABEL_STYLE)
+        ubs_label = CustomLabel('Upper bounds', alignment=Qt.AlignmentFlag.AlignRight, context='PropertyField')
         g_layout.addWidget(ubs_label, 3, 0)
 
-        self.ubs_box = CustomTextBox(f'{[ub for ub in self.upper_bounds]}'.replace('[', '').replace(']', ''))
+        self.ubs_box = CustomTextBox(', '.join(map(repr, self.upper_bounds)))
         g_layout.addWidget(self.ubs_box, 3, 1)
 
         self.set_buttons_text('Discard', 'Apply')
@@ -309,14 +314,11 @@ class EditBoxPropertyDialog(PropertyDialog):
 
         """
 
-        smt_string = ''
         symbol = self.property_block.ref_block.get_identifier()
 
-        for i in range(len(self.lower_bounds)):
-            smt_string += f'(assert (<= (* -1 {symbol}_{i}) {-self.lower_bounds[i]}))\n'
-            smt_string += f'(assert (<= {symbol}_{i} {self.upper_bounds[i]}))\n'
-
-        return smt_string
+        return ''.join(f'(assert (<= (* -1 {symbol}_{i}) {-lb}))\n'
+                       f'(assert (<= {symbol}_{i} {ub}))\n'
+                       for i, (lb, ub) in enumerate(zip(self.lower_bounds, self.upper_bounds)))
 
 
 class EditClassificationPropertyDialog(PropertyDialog):
@@ -398,13 +400,10 @@ class EditClassificationPropertyDialog(PropertyDialog):
 
         """
 
-        smt_string = ''
         varname = self.property_block.ref_block.get_identifier()
         varnum = self.var_cb.currentText().split('_')[-1]
+        target = int(varnum)
         operator = '<=' if self.min else '>='
 
-        for i in range(len(self.property_block.variables)):
-            if i != int(varnum):
-                smt_string += f'(assert ({operator} {varname}_{varnum} {varname}_{i}))\n'
-
-        return smt_string
+        return ''.join(f'(assert ({operator} {varname}_{varnum} {varname}_{i}))\n'
+                       for i in range(len(self.property_block.variables)) if i != target)
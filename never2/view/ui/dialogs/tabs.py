@@ -20,6 +20,10 @@ class VerificationTabWidget(QTabWidget):
         self.content_dict = content
         self.widgets_dict = {}
 
+        # The strategies are constant for the widget lifetime
+        self.strategies = self.content_dict['Verification strategy']
+        self.algo_names = list(self.strategies)
+
         # Init tabs
         self.build_tabs()
 
@@ -33,9 +37,7 @@ class VerificationTabWidget(QTabWidget):
         layouts = []
 
         # Add a new tab for each algorithm (key of the values for 'Verification Strategy')
-        algo_names = [name for name in self.content_dict['Verification strategy'].keys()]
-
-        for name in algo_names:
+        for name in self.algo_names:
             # Make a new layout and tab
             layouts.append(QFormLayout())
             tabs.append(QWidget(self))
@@ -45,7 +47,7 @@ class VerificationTabWidget(QTabWidget):
             # Refer to the last added in the loop
             tabs[-1].setLayout(cur_layout)
 
-            params_dict = self.content_dict['Verification strategy'][name]['params']
+            params_dict = self.strategies[name]['params']
 
             # Populate the tab
             for param in params_dict.keys():
@@ -83,7 +85,7 @@ class VerificationTabWidget(QTabWidget):
         """
 
         params = {}
-        strategy_name = list(self.content_dict['Verification strategy'].keys())[self.currentIndex()]
+        strategy_name = self.algo_names[self.currentIndex()]
 
         for k, v in self.widgets_dict.items():
             if strategy_name in k:
@@ -8,18 +8,21 @@ Author: Stefano Demarchi
 
 """
 
+import ast
 import logging
 import os
+import pickle
+import tempfile
+from collections import OrderedDict
 from typing import Callable
 
 import pynever.datasets as dt
 import torch
-import torch.nn.functional as fun
 import torch.optim as opt
 import torchvision.transforms as tr
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QGridLayout, QFileDialog
+from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QGridLayout, QStackedLayout, QFileDialog
 from pynever.datasets import Dataset
 from pynever.networks import NeuralNetwork, SequentialNetwork
 from pynever.strategies.training import PytorchTraining, PytorchMetrics
@@ -34,12 +37,63 @@ from never2 import RES_DIR, ROOT_DIR
 from never2.resources.styling.custom import CustomComboBox, CustomTextBox, CustomLabel, CustomButton, \
     CustomLoggerTextArea
 from never2.utils import rep, file
+from never2.utils.cached_dataset import CachedTransformDataset, GPUResidentDataset, get_cache_path
 from never2.utils.validator import ArithmeticValidator
+from never2.utils.worker import AsyncTask, TASK_POOL
 from never2.view.ui.dialogs.action import ComposeTransformDialog
 from never2.view.ui.dialogs.dialog import GenericDatasetDialog
 from never2.view.ui.dialogs.message import MessageDialog, MessageType
 from never2.view.ui.dialogs.tabs import VerificationTabWidget
 
+# Parameter types whose text is cast when committed
+NUMERIC_TYPES = ('int', 'float', 'tensor', 'tuple')
+
+# Casts from the widget text to the parameter type
+CASTERS = {'bool': lambda v: v == 'True',
+           'int': int,
+           'float': float,
+           'tuple': ast.literal_eval}
+
+# Built-in datasets: selection -> path, path -> (name, class)
+DATASET_PATHS = {'MNIST': ROOT_DIR + '/data/MNIST/',
+                 'Fashion MNIST': ROOT_DIR + '/data/fMNIST/'}
+DATASETS = {ROOT_DIR + '/data/MNIST/': ('MNIST', dt.TorchMNIST),
+            ROOT_DIR + '/data/fMNIST/': ('fMNIST', dt.TorchFMNIST)}
+
+# Built-in datasets already loaded, by cache path, the least recently used first
+DATASET_CACHE = OrderedDict()
+DATASET_CACHE_SIZE = 2
+
+# Built-in transforms, stateless and shared by all the windows
+TRANSFORMS = {'No transform': tr.Compose([]),
+              'Convolutional MNIST': tr.Compose([tr.ToTensor(), tr.Normalize(1, 0.5)]),
+              'Fully Connected MNIST': tr.Compose([tr.ToTensor(),
+                                                   tr.Normalize(1, 0.5),
+                                                   torch.nn.Flatten(0)])}
+
+# Training options: keys of training.json and pytorch classes by GUI label
+OPTIMIZER_KEY = 'Optimization algorithm'
+SCHEDULER_KEY = 'Learning rate scheduling'
+LOSS_KEY = 'Loss function measure'
+METRIC_KEY = 'Precision Metric'
+
+OPTIMIZERS = {'Adam': opt.Adam}
+SCHEDULERS = {'ReduceLROnPlateau': opt.lr_scheduler.ReduceLROnPlateau}
+
+# Verification options: GUI label -> pynever value
+SSLP_HEURISTICS = {'Complete': 'complete',
+                   'Approximate': 'overapprox',
+                   'Mixed': 'mixed'}
+SSBP_REFINEMENTS = {'Sequential': RefinementStrategy.SEQUENTIAL,
+                    'Lowest approximation': RefinementStrategy.LOWEST_APPROX,
+                    'Lowest approximation in layer': RefinementStrategy.LOWEST_APPROX_CURRENT_LAYER,
+                    'Input bounds change': RefinementStrategy.INPUT_BOUNDS_CHANGE}
+SSBP_BOUNDS = {'Symbolic': BoundsBackend.SYMBOLIC}
+SSBP_DIRECTIONS = {'Forwards': BoundsDirection.FORWARDS,
+                   'Backwards': BoundsDirection.BACKWARDS}
+SSBP_INTERSECTIONS = {'Star LP': IntersectionStrategy.STAR_LP,
+                      'Adaptive': IntersectionStrategy.ADAPTIVE}
+
 
 class BaseWindow(QtWidgets.QDialog):
     """
@@ -55,6 +109,10 @@ class BaseWindow(QtWidgets.QDialog):
         Window title to display.
     widgets : dict
         The dictionary of the displayed widgets.
+    log_textbox : CustomLoggerTextArea
+        The log area, created the first time a logger is attached.
+    loggers : list
+        The loggers writing to the log area.
 
     Methods
     ----------
@@ -62,6 +120,8 @@ class BaseWindow(QtWidgets.QDialog):
         Procedure to display the window layout.
     create_widget_layout(str, dict, Callable, Callable)
         Procedure to display widgets from a dictionary.
+    attach_logger(str)
+        Procedure to display the records of a logger.
 
     """
 
@@ -71,14 +131,12 @@ class BaseWindow(QtWidgets.QDialog):
         self.title = title
         self.params = dict()
         self.widgets = dict()
+        self.log_textbox = None
+        self.loggers = []
 
         self.setWindowTitle(self.title)
         self.setModal(True)
 
-        # apply same QLineEdit and QComboBox style of the block contents
-        qss_file = open(RES_DIR + '/styling/qss/blocks.qss').read()
-        self.setStyleSheet(qss_file)
-
     def render_layout(self) -> None:
         """
         This method updates the main_layout with the changes done
@@ -140,16 +198,15 @@ class BaseWindow(QtWidgets.QDialog):
                     self.widgets[first_level] = CustomTextBox()
                     self.widgets[first_level].setText(str(widget_dict[first_level].get('value', '')))
 
+                    # Numeric values are committed once the editing is over
                     if line_f is not None:
-                        self.widgets[first_level].textChanged.connect(line_f(first_level))
+                        if widget_dict[first_level]['type'] in NUMERIC_TYPES:
+                            self.widgets[first_level].editingFinished.connect(line_f(first_level))
+                        else:
+                            self.widgets[first_level].textChanged.connect(line_f(first_level))
 
-                    if widget_dict[first_level]['type'] == 'int':
-                        self.widgets[first_level].setValidator(ArithmeticValidator.INT)
-                    elif widget_dict[first_level]['type'] == 'float':
-                        self.widgets[first_level].setValidator(ArithmeticValidator.FLOAT)
-                    elif widget_dict[first_level]['type'] == 'tensor' or \
-                            widget_dict[first_level]['type'] == 'tuple':
-                        self.widgets[first_level].setValidator(ArithmeticValidator.TENSOR)
+                    self.widgets[first_level].setValidator(
+                        ArithmeticValidator.BY_TYPE.get(widget_dict[first_level]['type']))
 
             w_label = CustomLabel(first_level)
 
@@ -162,8 +219,47 @@ class BaseWindow(QtWidgets.QDialog):
             counter += 1
 
         widget_layout.addLayout(left_layout)
+
         return widget_layout
 
+    def attach_logger(self, name: str) -> logging.Logger:
+        """
+        This method adds the log area to the window on first use and
+        directs the records of the given logger to it.
+
+        Parameters
+        ----------
+        name : str
+            The name of the logger.
+
+        Returns
+        ----------
+        Logger
+            The logger attached.
+
+        """
+
+        if self.log_textbox is None:
+            self.log_textbox = CustomLoggerTextArea(self)
+            self.layout.addWidget(self.log_textbox.widget)
+
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+
+        if logger not in self.loggers:
+            logger.addHandler(self.log_textbox)
+            self.loggers.append(logger)
+
+        return logger
+
+    def done(self, result: int) -> None:
+        # Loggers are global, the handler must not outlive the window
+        for logger in self.loggers:
+            logger.removeHandler(self.log_textbox)
+        self.loggers.clear()
+
+        super().done(result)
+
 
 class TrainingWindow(BaseWindow):
     """
@@ -179,6 +275,12 @@ class TrainingWindow(BaseWindow):
     is_nn_trained : bool
         Flag signaling whether the training procedure succeeded
         or not.
+    is_training : bool
+        Flag signaling whether the training is running in the
+        worker thread.
+    is_closed : bool
+        Flag signaling that the window was closed, so that the
+        queued prefetch tasks are skipped.
     dataset_path : str
         The dataset path to train the network.
     dataset_params : dict
@@ -188,27 +290,39 @@ class TrainingWindow(BaseWindow):
     gui_params : dict
         The dictionary of secondary parameters displayed
         based on the selection.
-    grid_layout : QGridLayout
-        The layout to display the GUI parameters on.
+    grid_stack : QStackedLayout
+        The layout holding a page of GUI parameters per selection.
+    subgrids : dict
+        The pages of GUI parameters already built, by selection.
 
     Methods
     ----------
-    clear_grid()
-        Procedure to clear the grid layout.
     update_grid_view(str)
         Procedure to update the grid layout.
     show_layout(str)
-        Procedure to display the grid layout.
+        Procedure to build and display the grid layout.
     update_dict_value(str, str, str)
         Procedure to update the parameters.
     setup_dataset(str)
         Procedure to prepare the dataset loading.
     setup_transform(str)
         Procedure to add a transform to the dataset.
-    load_dataset()
-        Procedure to load the dataset.
+    load_dataset(str, Transform, dict)
+        Procedure to load the dataset, in the worker thread.
+    prefetch_dataset()
+        Procedure to prepare the dataset in background.
+    prefetch_task(str, Transform)
+        Procedure to load the selected dataset, in the worker thread.
+    prefetch_error(str)
+        Procedure to report a prefetch error.
     execute_training()
         Procedure to launch the training.
+    train_task(Logger, tuple, dict, type, dict, type, dict, Callable, Callable, str)
+        Procedure to load the dataset and train, in the worker thread.
+    training_finished(NeuralNetwork)
+        Procedure to collect the training result.
+    training_error(str)
+        Procedure to report a training error.
 
     """
 
@@ -221,11 +335,16 @@ class TrainingWindow(BaseWindow):
         self.dataset_path = ''
         self.dataset_params = dict()
         self.dataset_transform = tr.Compose([])
-        self.params = rep.read_json(RES_DIR + '/json/training.json')
+        self.is_training = False
+        self.is_closed = False
+        self.task_signals = None
+        self.prefetch_signals = None
+        self.params = rep.read_json_copy(RES_DIR + '/json/training.json')
         self.gui_params = dict()
         self.loss_f = ''
         self.metric = ''
-        self.grid_layout = QGridLayout()
+        self.grid_stack = QStackedLayout()
+        self.subgrids = dict()
 
         # Dataset
         dt_label = CustomLabel('Dataset', primary=True)
@@ -264,8 +383,7 @@ class TrainingWindow(BaseWindow):
             return lambda: self.update_dict_value(key, '', self.widgets[key].text())
 
         body_layout = self.create_widget_layout(self.params, activation_combo, activation_line)
-        body_layout.addLayout(self.grid_layout)
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        body_layout.addLayout(self.grid_stack)
         self.layout.addLayout(body_layout)
 
         # Buttons
@@ -280,16 +398,6 @@ class TrainingWindow(BaseWindow):
 
         self.render_layout()
 
-    def clear_grid(self) -> None:
-        """
-        This method clears the grid view of the layout,
-        in order to display fresh new infos.
-
-        """
-
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().deleteLater()
-
     def update_grid_view(self, caller: str) -> None:
         """
         This method updates the grid view of the layout,
@@ -303,24 +411,27 @@ class TrainingWindow(BaseWindow):
 
         """
 
-        self.clear_grid()
-        if 'Loss Function' in caller:
+        if caller.startswith(f'{LOSS_KEY}:'):
             self.loss_f = caller
-        elif 'Precision Metric' in caller:
+        elif caller.startswith(f'{METRIC_KEY}:'):
             self.metric = caller
 
-        for first_level in self.params.keys():
-            if type(self.params[first_level]) == dict:
-                for second_level in self.params[first_level].keys():
-                    if caller == f'{first_level}:{second_level}' and caller not in self.gui_params:
-                        self.gui_params[caller] = self.params[first_level][second_level]
+        if caller not in self.gui_params:
+            first_level, second_level = caller.split(':', 1)
+            node = self.params.get(first_level, {}).get(second_level)
+            if isinstance(node, dict):
+                self.gui_params[caller] = node
 
-        self.show_layout(caller)
+        # Pages are built once and switched afterwards, keeping the values edited
+        if caller in self.subgrids:
+            self.grid_stack.setCurrentWidget(self.subgrids[caller])
+        else:
+            self.show_layout(caller)
 
     def show_layout(self, name: str) -> None:
         """
-        This method displays a grid layout initialized by the
-        dictionary of parameters and default values.
+        This method builds a page with a grid layout initialized by the
+        dictionary of parameters and default values, and displays it.
 
         Parameters
         ----------
@@ -330,9 +441,16 @@ class TrainingWindow(BaseWindow):
 
         """
 
+        # Repaint once after all the widgets are added
+        self.setUpdatesEnabled(False)
+
+        page = QtWidgets.QWidget()
+        grid_layout = QGridLayout(page)
+        grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
         title = CustomLabel(name.replace(':', ': '))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.grid_layout.addWidget(title, 0, 0, 1, 2)
+        grid_layout.addWidget(title, 0, 0, 1, 2)
         widgets_2level = dict()
 
         count = 1
@@ -362,22 +480,25 @@ class TrainingWindow(BaseWindow):
                 widgets_2level[f'{name}:{k}'] = (w_label, cb)
             else:
                 tb = CustomTextBox(str(v['value']))
-                tb.textChanged.connect(activation_line(name, k))
+                if v['type'] in NUMERIC_TYPES:
+                    tb.editingFinished.connect(activation_line(name, k))
+                else:
+                    tb.textChanged.connect(activation_line(name, k))
 
-                if v['type'] == 'int':
-                    tb.setValidator(ArithmeticValidator.INT)
-                elif v['type'] == 'float':
-                    tb.setValidator(ArithmeticValidator.FLOAT)
-                elif v['type'] == 'tensor' or \
-                        v['type'] == 'tuple':
-                    tb.setValidator(ArithmeticValidator.TENSOR)
+                tb.setValidator(ArithmeticValidator.BY_TYPE.get(v['type']))
 
                 widgets_2level[f'{name}:{k}'] = (w_label, tb)
 
-            self.grid_layout.addWidget(widgets_2level[f'{name}:{k}'][0], count, 0)
-            self.grid_layout.addWidget(widgets_2level[f'{name}:{k}'][1], count, 1)
+            grid_layout.addWidget(widgets_2level[f'{name}:{k}'][0], count, 0)
+            grid_layout.addWidget(widgets_2level[f'{name}:{k}'][1], count, 1)
             count += 1
 
+        self.subgrids[name] = page
+        self.grid_stack.addWidget(page)
+        self.grid_stack.setCurrentWidget(page)
+
+        self.setUpdatesEnabled(True)
+
     def update_dict_value(self, name: str, key: str, value: str) -> None:
         """
         This method updates the correct parameter based
@@ -403,14 +524,13 @@ class TrainingWindow(BaseWindow):
         else:
             gui_param = self.gui_params[name][key]
 
-        if gui_param['type'] == 'bool':
-            value = value == 'True'
-        elif gui_param['type'] == 'int' and value != '':
-            value = int(value)
-        elif gui_param['type'] == 'float' and value != '':
-            value = float(value)
-        elif gui_param['type'] == 'tuple' and value != '':
-            value = eval(value)
+        caster = CASTERS.get(gui_param['type'])
+        if caster is not None and (value != '' or gui_param['type'] == 'bool'):
+            try:
+                value = caster(value)
+            except (ValueError, SyntaxError):
+                # Incomplete or invalid value, keep the previous one
+                return
 
         # Apply changes
         if ':' in name:
@@ -432,20 +552,27 @@ class TrainingWindow(BaseWindow):
 
         """
 
-        if name == 'MNIST':
-            self.dataset_path = ROOT_DIR + '/data/MNIST/'
-        elif name == 'Fashion MNIST':
-            self.dataset_path = ROOT_DIR + '/data/fMNIST/'
+        if name in DATASET_PATHS:
+            self.dataset_path = DATASET_PATHS[name]
         else:
-            datapath = QFileDialog.getOpenFileName(None, 'Select data source...', '')
+            # Reopen the dialog where the last data source was picked
+            settings = QSettings('NeVer', 'NeVer2')
+            last_dir = settings.value('last_dataset_dir', '')
+
+            datapath = QFileDialog.getOpenFileName(self, 'Select data source...', last_dir)
             self.dataset_path = datapath[0]
 
+            if self.dataset_path != '':
+                settings.setValue('last_dataset_dir', os.path.dirname(self.dataset_path))
+
             # Get additional parameters via dialog
             if self.dataset_path != '':
                 dialog = GenericDatasetDialog()
                 dialog.exec()
                 self.dataset_params = dialog.params
 
+        self.prefetch_dataset()
+
     def setup_transform(self, sel_t: str) -> None:
         """
         This method prepares the dataset transform based on the user choice
@@ -457,23 +584,29 @@ class TrainingWindow(BaseWindow):
 
         """
 
-        if sel_t == 'No transform':
-            self.dataset_transform = tr.Compose([])
-        elif sel_t == 'Convolutional MNIST':
-            self.dataset_transform = tr.Compose([tr.ToTensor(), tr.Normalize(1, 0.5)])
-        elif sel_t == 'Fully Connected MNIST':
-            self.dataset_transform = tr.Compose([tr.ToTensor(),
-                                                 tr.Normalize(1, 0.5),
-                                                 tr.Lambda(lambda x: torch.flatten(x))])
+        if sel_t in TRANSFORMS:
+            self.dataset_transform = TRANSFORMS[sel_t]
         else:
             dialog = ComposeTransformDialog()
             dialog.exec()
             self.dataset_transform = tr.Compose(dialog.trList)
 
-    def load_dataset(self) -> Dataset:
+        self.prefetch_dataset()
+
+    def load_dataset(self, path: str, transform, params: dict) -> Dataset:
         """
-        This method initializes the selected dataset object,
-        given the path loaded before.
+        This method initializes the selected dataset object. Building
+        the object may download or read the whole dataset, so it is
+        meant to run in the worker thread.
+
+        Parameters
+        ----------
+        path : str
+            The dataset path.
+        transform : Transform
+            The transform of the samples.
+        params : dict
+            Additional parameters for generic datasets.
 
         Returns
         ----------
@@ -482,21 +615,91 @@ class TrainingWindow(BaseWindow):
 
         """
 
-        if self.dataset_path == ROOT_DIR + '/data/MNIST/':
-            return dt.TorchMNIST(self.dataset_path, True, self.dataset_transform)
-        elif self.dataset_path == ROOT_DIR + '/data/fMNIST/':
-            return dt.TorchFMNIST(self.dataset_path, True, self.dataset_transform)
-        elif self.dataset_path != '':
-            return dt.GenericFileDataset(self.dataset_path,
-                                         self.nn.get_input_len(),
-                                         self.dataset_params['data_type'],
-                                         self.dataset_params['delimiter'],
-                                         self.dataset_transform)
+        if path in DATASETS:
+            name, dataset_class = DATASETS[path]
+            cache_path = get_cache_path(path, name, True, transform)
+
+            # Reuse the samples of a previous training with the same transform
+            if cache_path in DATASET_CACHE:
+                DATASET_CACHE.move_to_end(cache_path)
+                return DATASET_CACHE[cache_path]
+
+            dataset = CachedTransformDataset(dataset_class(path, True, transform), cache_path)
+            DATASET_CACHE[cache_path] = dataset
+            if len(DATASET_CACHE) > DATASET_CACHE_SIZE:
+                DATASET_CACHE.popitem(last=False)
+
+            return dataset
+        elif path != '':
+            # The file is read in a single tensor, a cache would only duplicate it
+            return dt.GenericFileDataset(path, self.nn.get_input_len(), params['data_type'], params['delimiter'],
+                                         transform)
+
+    def prefetch_dataset(self) -> None:
+        """
+        This method starts preparing the selected dataset in background,
+        so that the transformed samples are ready when the training starts.
+        Only the built-in datasets are prefetched, since a generic file is
+        read when the dataset object is built.
+
+        """
+
+        if self.widgets['Background prefetch'].currentText() != 'True':
+            return
+
+        if self.dataset_path in DATASETS:
+            path, transform = self.dataset_path, self.dataset_transform
+
+            # The prepared dataset is kept in DATASET_CACHE, where the training finds it
+            task = AsyncTask(lambda: self.prefetch_task(path, transform))
+            task.signals.error.connect(self.prefetch_error)
+
+            # Only the signals of the latest prefetch are kept until delivered
+            self.prefetch_signals = task.signals
+            TASK_POOL.start(task)
+
+    def prefetch_task(self, path: str, transform) -> None:
+        """
+        This method builds the dataset and its transformed samples. It is
+        meant to run in the worker thread, which also runs the training,
+        so the dataset cache is only used by one thread.
+
+        Parameters
+        ----------
+        path : str
+            The dataset path.
+        transform : Transform
+            The transform of the samples.
+
+        """
+
+        # Skip the window closed or the selections changed while the task was waiting
+        if self.is_closed or path != self.dataset_path or transform is not self.dataset_transform:
+            return
+
+        self.load_dataset(path, transform, dict()).wait()
+
+    def prefetch_error(self, message: str) -> None:
+        """
+        This method reports an error raised by the prefetch in the GUI thread.
+        The training will try loading the dataset again.
+
+        Parameters
+        ----------
+        message : str
+            The error message.
+
+        """
+
+        if not self.is_closed:
+            dialog = MessageDialog('Dataset loading error:\n' + message, MessageType.ERROR)
+            dialog.exec()
 
     def execute_training(self) -> None:
         """
         This method reads the inout from the window widgets and
         launches the training procedure on the selected dataset.
+        The dataset loading and the training run in a worker thread.
 
         """
 
@@ -504,13 +707,13 @@ class TrainingWindow(BaseWindow):
 
         if self.dataset_path == '':
             err_message = 'No dataset selected.'
-        elif self.widgets['Optimizer'].currentIndex() == -1:
+        elif self.widgets[OPTIMIZER_KEY].currentIndex() == -1:
             err_message = 'No optimizer selected.'
-        elif self.widgets['Scheduler'].currentIndex() == -1:
+        elif self.widgets[SCHEDULER_KEY].currentIndex() == -1:
             err_message = 'No scheduler selected.'
-        elif self.widgets['Loss Function'].currentIndex() == -1:
+        elif self.widgets[LOSS_KEY].currentIndex() == -1:
             err_message = 'No loss function selected.'
-        elif self.widgets['Precision Metric'].currentIndex() == -1:
+        elif self.widgets[METRIC_KEY].currentIndex() == -1:
             err_message = 'No metrics selected.'
         elif 'value' not in self.params['Epochs'].keys():
             err_message = 'No epochs selected.'
@@ -525,97 +728,187 @@ class TrainingWindow(BaseWindow):
             err_dialog = MessageDialog(err_message, MessageType.ERROR)
             err_dialog.exec()
             self.close()
-
-        # Load dataset
-        data = self.load_dataset()
+            return
 
         # Add logger text box
-        log_textbox = CustomLoggerTextArea(self)
-        logger = logging.getLogger('pynever.strategies.training')
-        logger.addHandler(log_textbox)
-        logger.setLevel(logging.INFO)
-        self.layout.addWidget(log_textbox.widget)
+        logger = self.attach_logger('pynever.strategies.training')
 
         logger.info('***** NeVer 2 - TRAINING *****')
 
         # Create optimizer dictionary of parameters
-        opt_params = dict()
-        for k, v in self.gui_params['Optimizer:Adam'].items():
-            opt_params[v['name']] = v['value']
+        optimizer = self.widgets[OPTIMIZER_KEY].currentText()
+        opt_params = {v['name']: v['value'] for v in self.gui_params[f'{OPTIMIZER_KEY}:{optimizer}'].values()}
 
         # Create scheduler dictionary of parameters
-        sched_params = dict()
-        for k, v in self.gui_params['Scheduler:ReduceLROnPlateau'].items():
-            sched_params[v['name']] = v['value']
+        scheduler = self.widgets[SCHEDULER_KEY].currentText()
+        sched_params = {v['name']: v['value'] for v in self.gui_params[f'{SCHEDULER_KEY}:{scheduler}'].values()}
 
         # Init loss function
-        if self.loss_f == 'Loss Function:Cross Entropy':
-            loss = torch.nn.CrossEntropyLoss()
-            if self.gui_params['Loss Function:Cross Entropy']['Weight']['value'] != '':
-                loss.weight = self.gui_params['Loss Function:Cross Entropy']['Weight']['value']
-            loss.ignore_index = self.gui_params['Loss Function:Cross Entropy']['Ignore index']['value']
-            loss.reduction = self.gui_params['Loss Function:Cross Entropy']['Reduction']['value']
+        if self.loss_f == f'{LOSS_KEY}:Cross Entropy':
+            ce_params = {k: v['value'] for k, v in self.gui_params[self.loss_f].items()}
+            weight = None
+            if ce_params['Weight'] != '':
+                weight = torch.tensor([float(w) for w in str(ce_params['Weight']).split(',')])
+            loss = torch.nn.CrossEntropyLoss(weight=weight,
+                                             ignore_index=ce_params['Ignore index'],
+                                             reduction=ce_params['Reduction'])
         else:
-            loss = fun.mse_loss
-            loss.reduction = self.gui_params['Loss Function:MSE Loss']['Reduction']['value']
+            loss = torch.nn.MSELoss(reduction=self.gui_params[f'{LOSS_KEY}:MSE Loss']['Reduction']['value'])
 
         # Init metrics
-        if self.metric == 'Precision Metric:Inaccuracy':
+        if self.metric == f'{METRIC_KEY}:Inaccuracy':
             metrics = PytorchMetrics.inaccuracy
         else:
-            metrics = fun.mse_loss
-            metrics.reduction = self.gui_params['Precision Metric:MSE Loss']['Reduction']['value']
+            metrics = torch.nn.MSELoss(reduction=self.gui_params[f'{METRIC_KEY}:MSE Loss']['Reduction']['value'])
+
+        if self.widgets['Cuda'].currentText() == 'True':
+            cuda_device = 'cuda'
+        else:
+            cuda_device = 'cpu'
+
+        # Snapshot of the values, the worker must not read the editable parameters
+        values = {k: v.get('value') for k, v in self.params.items() if 'type' in v}
+        dataset = (self.dataset_path, self.dataset_transform, self.dataset_params)
+
+        # Launch the training outside the GUI thread
+        self.is_training = True
+        self.train_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+
+        task = AsyncTask(lambda: self.train_task(logger, dataset, values, OPTIMIZERS[optimizer], opt_params,
+                                                 SCHEDULERS[scheduler], sched_params,
+                                                 loss, metrics, cuda_device))
+        task.signals.finished.connect(self.training_finished)
+        task.signals.error.connect(self.training_error)
+
+        # The pool owns the task, only its signals are kept until delivered
+        self.task_signals = task.signals
+        TASK_POOL.start(task)
+
+    def train_task(self, logger: logging.Logger, dataset: tuple, values: dict, opt_con: type, opt_params: dict,
+                   sched_con: type, sched_params: dict, loss: Callable, metrics: Callable,
+                   cuda_device: str) -> NeuralNetwork | None:
+        """
+        This method loads the dataset and the checkpoint and trains the
+        network. It is meant to run in the worker thread.
+
+        Returns
+        ----------
+        NeuralNetwork | None
+            The trained network, or None if the checkpoint already
+            reached the required epochs.
+
+        """
+
+        # Load dataset
+        data = self.load_dataset(*dataset)
+        logger.info('Dataset loaded')
 
         # Checkpoint loading
-        checkpoints_path = self.params['Checkpoints root'].get('value', '') + self.nn.identifier + '.pth.tar'
+        checkpoints_path = (values['Checkpoints root'] or '') + self.nn.identifier + '.pth.tar'
         if not os.path.isfile(checkpoints_path):
             checkpoints_path = None
 
-        start_epoch = 0
         if checkpoints_path is not None:
-            checkpoint = torch.load(checkpoints_path)
+            # Only the epoch is read, the tensors are mapped and not loaded
+            try:
+                checkpoint = torch.load(checkpoints_path, map_location='cpu', mmap=True, weights_only=True)
+            except pickle.UnpicklingError:
+                # The checkpoint also stores objects other than tensors and primitives
+                checkpoint = torch.load(checkpoints_path, map_location='cpu', mmap=True, weights_only=False)
             start_epoch = checkpoint['epoch']
-            if self.params['Epochs']['value'] <= start_epoch:
-                start_epoch = -1
+            logger.info('Checkpoint loaded')
+
+            if values['Epochs'] <= start_epoch:
                 logger.info('Checkpoint already reached, no further training necessary')
+                return None
+
+        # Keep small datasets entirely on the GPU
+        if cuda_device == 'cuda' and isinstance(data, CachedTransformDataset):
+            data.wait()
+            gpu_limit = (values['GPU cache limit'] or 0) * 2 ** 20
+            if data.data is not None and data.data.nbytes <= gpu_limit:
+                data = GPUResidentDataset(data, cuda_device)
+
+        # Init train strategy
+        train_strategy = PytorchTraining(opt_con, opt_params,
+                                         loss,
+                                         values['Epochs'],
+                                         values['Validation percentage'] / 100,
+                                         values['Training batch size'],
+                                         values['Validation batch size'],
+                                         True,
+                                         sched_con,
+                                         sched_params,
+                                         metrics,
+                                         device=cuda_device,
+                                         train_patience=values['Train patience'],
+                                         checkpoints_root=values['Checkpoints root'] or '',
+                                         verbose_rate=values['Verbosity level'])
+
+        return train_strategy.train(self.nn, data)
+
+    def training_finished(self, trained_nn: NeuralNetwork | None) -> None:
+        """
+        This method collects the result of the training in the GUI thread.
 
-        if start_epoch > -1:
-            # Init train strategy
-            if self.params['Cuda']['value'] == 'True':
-                cuda_device = 'cuda'
-            else:
-                cuda_device = 'cpu'
-            train_strategy = PytorchTraining(opt.Adam, opt_params,
-                                             loss,
-                                             self.params['Epochs']['value'],
-                                             self.params['Validation percentage']['value'] / 100,
-                                             self.params['Training batch size']['value'],
-                                             self.params['Validation batch size']['value'],
-                                             True,
-                                             opt.lr_scheduler.ReduceLROnPlateau,
-                                             sched_params,
-                                             metrics,
-                                             device=cuda_device,
-                                             train_patience=self.params['Train patience'].get('value', None),
-                                             checkpoints_root=self.params['Checkpoints root'].get('value', ''),
-                                             verbose_rate=self.params['Verbosity level'].get('value', None))
-            try:
-                self.nn = train_strategy.train(self.nn, data)
-                self.is_nn_trained = True
+        Parameters
+        ----------
+        trained_nn : NeuralNetwork | None
+            The trained network, if any.
 
-                # Delete checkpoint if the network isn't saved
-                if self.nn.identifier == '':
-                    os.remove('.pth.tar')
+        """
 
-            except Exception as e:
-                self.nn = None
-                dialog = MessageDialog('Training error:\n' + str(e), MessageType.ERROR)
-                dialog.exec()
-                self.close()
+        self.is_training = False
+        self.task_signals = None
 
-        self.train_btn.setEnabled(False)
+        if trained_nn is not None:
+            self.nn = trained_nn
+            self.is_nn_trained = True
+
+            # Delete checkpoint if the network isn't saved
+            if self.nn.identifier == '':
+                os.remove('.pth.tar')
+
+        self.cancel_btn.setEnabled(True)
         self.cancel_btn.setText('Close')
 
+    def training_error(self, message: str) -> None:
+        """
+        This method reports an error raised by the training in the GUI thread.
+
+        Parameters
+        ----------
+        message : str
+            The error message.
+
+        """
+
+        self.is_training = False
+        self.task_signals = None
+        self.nn = None
+        self.cancel_btn.setEnabled(True)
+
+        dialog = MessageDialog('Training error:\n' + message, MessageType.ERROR)
+        dialog.exec()
+        self.close()
+
+    def reject(self) -> None:
+        # The window cannot be dismissed while the worker is running
+        if not self.is_training:
+            super().reject()
+
+    def closeEvent(self, event) -> None:
+        if self.is_training:
+            event.ignore()
+        else:
+            super().closeEvent(event)
+
+    def done(self, result: int) -> None:
+        # The queued prefetch tasks are no longer needed
+        self.is_closed = True
+        super().done(result)
+
 
 class VerificationWindow(BaseWindow):
     """
@@ -633,11 +926,20 @@ class VerificationWindow(BaseWindow):
         The verification class to use in the verification procedure
     params : dict
         Dictionary of parameters to load in the window
+    is_verifying : bool
+        Flag signaling whether the verification is running in the
+        worker thread.
 
     Methods
     ----------
-    execute_verification()
+    set_and_launch_verification()
         Procedure to launch the verification.
+    verify_task(VerificationStrategy)
+        Procedure to read the property and verify, in the worker thread.
+    verification_finished(object)
+        Procedure to collect the verification result.
+    verification_error(str)
+        Procedure to report a verification error.
 
     """
 
@@ -647,8 +949,10 @@ class VerificationWindow(BaseWindow):
         self.nn = nn
         self.properties = properties
         self.strategy = None  # VerificationStrategy
+        self.is_verifying = False
+        self.task_signals = None
 
-        self.params = rep.read_json(RES_DIR + '/json/verification.json')
+        self.params = rep.read_json_copy(RES_DIR + '/json/verification.json')
 
         # Content
         tab_layout = QHBoxLayout()
@@ -679,47 +983,112 @@ class VerificationWindow(BaseWindow):
 
         """
 
-        # Set up verification property
-        path = 'never2/' + self.__repr__().split(' ')[-1].replace('>', '') + '.smt2'
-        file.write_smt_property(path, self.properties, 'Real')
-
         # Add logger text box
-        log_textbox = CustomLoggerTextArea(self)
-        logger = logging.getLogger('pynever.strategies.verification')
-        logger.addHandler(log_textbox)
-        logger.setLevel(logging.INFO)
-        self.layout.addWidget(log_textbox.widget)
+        logger = self.attach_logger('pynever.strategies.verification')
 
         logger.info('***** NeVer 2 - VERIFICATION *****')
 
-        # Load property from file
-        to_verify = VnnLibProperty(path)
-        # Property read, delete file
-        os.remove(path)
-
         # Retrieve verification parameters
         strategy, raw_params = self.verification_tabs.get_params()
         match strategy:
             case 'SSLP':
-                abst_logger = logging.getLogger('pynever.strategies.abstraction.layers')
-                abst_logger.setLevel(logging.INFO)
-                abst_logger.addHandler(log_textbox)
+                self.attach_logger('pynever.strategies.abstraction.layers')
                 self.strategy = SSLPVerification(self.get_verification_params(strategy, raw_params))
 
             case 'SSBP':
-                bp_logger = logging.getLogger("pynever.strategies.bounds_propagation")
-                bp_logger.setLevel(logging.INFO)
-                bp_logger.addHandler(log_textbox)
+                self.attach_logger('pynever.strategies.bounds_propagation')
                 self.strategy = SSBPVerification(self.get_verification_params(strategy, raw_params))
 
             case _:
                 raise NotImplementedError(f'The selected strategy {strategy} is not yet implemented')
 
-        # Launch verification
-        self.strategy.verify(self.nn, to_verify)
+        # Launch the verification outside the GUI thread
+        self.is_verifying = True
         self.verify_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+
+        task = AsyncTask(lambda: self.verify_task(self.strategy))
+        task.signals.finished.connect(self.verification_finished)
+        task.signals.error.connect(self.verification_error)
+
+        # The pool owns the task, only its signals are kept until delivered
+        self.task_signals = task.signals
+        TASK_POOL.start(task)
+
+    def verify_task(self, strategy) -> object:
+        """
+        This method writes and reads back the property and verifies
+        the network. It is meant to run in the worker thread.
+
+        Parameters
+        ----------
+        strategy : VerificationStrategy
+            The verification strategy to apply.
+
+        Returns
+        ----------
+        object
+            The verification result.
+
+        """
+
+        # VnnLibProperty only reads files: write the property text once to a private temporary file
+        fd, path = tempfile.mkstemp(suffix='.smt2')
+        try:
+            with os.fdopen(fd, 'w') as smt_file:
+                smt_file.write(file.smt_property_to_string(self.properties, 'Real'))
+            to_verify = VnnLibProperty(path)
+        finally:
+            os.remove(path)
+
+        return strategy.verify(self.nn, to_verify)
+
+    def verification_finished(self, result: object) -> None:
+        """
+        This method collects the verification result in the GUI thread.
+
+        Parameters
+        ----------
+        result : object
+            The verification result, reported by the logger.
+
+        """
+
+        self.is_verifying = False
+        self.task_signals = None
+        self.cancel_btn.setEnabled(True)
         self.cancel_btn.setText('Close')
 
+    def verification_error(self, message: str) -> None:
+        """
+        This method reports an error raised by the verification in the GUI thread.
+
+        Parameters
+        ----------
+        message : str
+            The error message.
+
+        """
+
+        self.is_verifying = False
+        self.task_signals = None
+        self.cancel_btn.setEnabled(True)
+
+        dialog = MessageDialog('Verification error:\n' + message, MessageType.ERROR)
+        dialog.exec()
+        self.close()
+
+    def reject(self) -> None:
+        # The window cannot be dismissed while the worker is running
+        if not self.is_verifying:
+            super().reject()
+
+    def closeEvent(self, event) -> None:
+        if self.is_verifying:
+            event.ignore()
+        else:
+            super().closeEvent(event)
+
     def get_verification_params(self, strategy: str, raw_params: dict[str, str]) \
             -> SSLPVerificationParameters | SSBPVerificationParameters:
         """
@@ -742,15 +1111,7 @@ class VerificationWindow(BaseWindow):
         match strategy:
             case 'SSLP':
 
-                match raw_params['heuristic']:
-                    case 'Complete':
-                        heuristic = 'complete'
-                    case 'Approximate':
-                        heuristic = 'overapprox'
-                    case 'Mixed':
-                        heuristic = 'mixed'
-                    case _:
-                        heuristic = 'complete'
+                heuristic = SSLP_HEURISTICS.get(raw_params['heuristic'], 'complete')
 
                 neurons = None
                 approx_levels = None
@@ -765,39 +1126,10 @@ class VerificationWindow(BaseWindow):
 
             case 'SSBP':
 
-                match raw_params['heuristic']:
-                    case 'Sequential':
-                        refinement = RefinementStrategy.SEQUENTIAL
-                    case 'Lowest approximation':
-                        refinement = RefinementStrategy.LOWEST_APPROX
-                    case 'Lowest approximation in layer':
-                        refinement = RefinementStrategy.LOWEST_APPROX_CURRENT_LAYER
-                    case 'Input bounds change':
-                        refinement = RefinementStrategy.INPUT_BOUNDS_CHANGE
-                    case _:
-                        refinement = RefinementStrategy.SEQUENTIAL
-
-                match raw_params['bounds']:
-                    case 'Symbolic':
-                        bounds = BoundsBackend.SYMBOLIC
-                    case _:
-                        bounds = BoundsBackend.SYMBOLIC
-
-                match raw_params['bounds_direction']:
-                    case 'Forwards':
-                        direction = BoundsDirection.FORWARDS
-                    case 'Backwards':
-                        direction = BoundsDirection.BACKWARDS
-                    case _:
-                        direction = BoundsDirection.FORWARDS
-
-                match raw_params['intersection']:
-                    case 'Star LP':
-                        intersection = IntersectionStrategy.STAR_LP
-                    case 'Adaptive':
-                        intersection = IntersectionStrategy.ADAPTIVE
-                    case _:
-                        intersection = IntersectionStrategy.STAR_LP
+                refinement = SSBP_REFINEMENTS.get(raw_params['heuristic'], RefinementStrategy.SEQUENTIAL)
+                bounds = SSBP_BOUNDS.get(raw_params['bounds'], BoundsBackend.SYMBOLIC)
+                direction = SSBP_DIRECTIONS.get(raw_params['bounds_direction'], BoundsDirection.FORWARDS)
+                intersection = SSBP_INTERSECTIONS.get(raw_params['intersection'], IntersectionStrategy.STAR_LP)
 
                 timeout = int(raw_params['timeout'])
 
@@ -22,7 +22,6 @@ from never2.model.scene import Scene
 from never2.utils.file import FileFormat, read_properties
 from never2.view.component.inspector import InspectorDockToolbar
 from never2.view.ui.dialogs.message import MessageDialog, MessageType, ConfirmDialog, FuncDialog
-from never2.view.ui.dialogs.window import TrainingWindow, VerificationWindow
 
 
 class EditorWidget(QWidget):
@@ -221,12 +220,15 @@ class EditorWidget(QWidget):
             dialog = MessageDialog('No network to train.', MessageType.ERROR)
             dialog.exec()
         else:
+            # The windows bring in torch, torchvision and the pynever strategies: load them on first use
+            from never2.view.ui.dialogs.window import TrainingWindow
+
             window = TrainingWindow(self.scene.project.nn)
             window.exec()
 
             if window.is_nn_trained:
                 dialog = FuncDialog('Training completed. Weights and biases updated.\nSave network?',
-                                    self.scene.project.save(False))
+                                    lambda: self.scene.project.save(False))
                 dialog.exec()
 
     def verify_network(self):
@@ -244,6 +246,8 @@ class EditorWidget(QWidget):
             dialog.exec()
 
         else:
+            from never2.view.ui.dialogs.window import VerificationWindow
+
             window = VerificationWindow(self.scene.project.nn, self.scene.get_properties())
             window.exec()
 
@@ -257,5 +261,5 @@ class EditorWidget(QWidget):
             item = self.scene.graphics_scene.selectedItems()
 
             if hasattr(item[0], 'block_ref'):
-                if isinstance(item[0].block_ref, LayerBlock) or isinstance(item[0].block_ref, PropertyBlock):
+                if isinstance(item[0].block_ref, (LayerBlock, PropertyBlock)):
                     self.inspector.display(item[0].block_ref)
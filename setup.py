@@ -13,7 +13,8 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type='text/markdown',
     url='https://github.com/NeVerTools/NeVer2',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(include=['never2', 'never2.*']),
+    package_data={'never2.resources': ['icons/*.png', 'json/*.json', 'styling/qss/*.qss']},
     classifiers=[
         'Programming Language:: Python:: 3.11',
         'Development Status:: 4 - Beta',